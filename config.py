@@ -35,12 +35,17 @@ class Settings(BaseSettings):
     
     # Summary settings
     summary_time: str = Field("12:00", env="SUMMARY_TIME")
+    overdue_reminder_time: str = Field("16:00", env="OVERDUE_REMINDER_TIME")
+    summary_max_messages: int = Field(500, env="SUMMARY_MAX_MESSAGES")  # most recent ones
     
     # Database
     database_url: str = Field(
         "sqlite+aiosqlite:///./sanechek.db", 
         env="DATABASE_URL"
     )
+    db_pool_size: int = Field(5, env="DB_POOL_SIZE")
+    db_max_overflow: int = Field(10, env="DB_MAX_OVERFLOW")
+    db_pool_recycle: int = Field(1800, env="DB_POOL_RECYCLE")  # seconds
     
     # Limits
     max_task_length: int = 500
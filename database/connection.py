@@ -1,6 +1,8 @@
 """Database connection and session management."""
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
@@ -12,11 +14,40 @@ class Base(DeclarativeBase):
     pass
 
 
+def _connect_args(database_url: str) -> dict:
+    """Driver-specific connection arguments."""
+    if database_url.startswith("postgresql+asyncpg"):
+        return {
+            # Reuse prepared statements for repeated Task/User/Chat lookups
+            "prepared_statement_cache_size": 1024,
+            # JIT only slows down the short OLTP queries the bot runs
+            "server_settings": {"jit": "off"},
+        }
+    return {}
+
+
+def _pool_args(database_url: str) -> dict:
+    """Connection pool settings: keep warm connections for short scheduler sessions."""
+    if ":memory:" in database_url:
+        # In-memory SQLite uses a single static connection
+        return {}
+    return {
+        "poolclass": AsyncAdaptedQueuePool,
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": 30,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": True,
+    }
+
+
 # Create async engine
 engine = create_async_engine(
     settings.database_url,
     echo=False,
     future=True,
+    connect_args=_connect_args(settings.database_url),
+    **_pool_args(settings.database_url),
 )
 
 # Create async session factory
@@ -48,5 +79,17 @@ async def init_db() -> None:
     from handlers.ask import AskUsage  # Import to register model
     
     async with engine.begin() as conn:
+        if conn.dialect.name == "postgresql":
+            # Trigram index on users.first_name (ILIKE '%...%')
+            await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
         await conn.run_sync(Base.metadata.create_all)
+        # create_all skips indexes of tables that already exist
+        await conn.run_sync(_create_missing_indexes)
+
+
+def _create_missing_indexes(conn) -> None:
+    """Create indexes added to models after their tables were created."""
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(conn, checkfirst=True)
 
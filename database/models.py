@@ -4,7 +4,7 @@ from enum import Enum
 from typing import Optional, List
 from sqlalchemy import (
     String, Integer, BigInteger, Boolean, DateTime, 
-    ForeignKey, Numeric, Text, Enum as SQLEnum
+    ForeignKey, Numeric, Text, Index, Enum as SQLEnum
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -78,6 +78,17 @@ class User(Base):
         return f"User {self.id}"
 
 
+# Assignee lookup: exact username first, then substring match on first name
+# (trigram GIN on Postgres, needs pg_trgm; a plain index elsewhere)
+Index("ix_users_username", User.username)
+Index(
+    "ix_users_first_name_trgm",
+    User.first_name,
+    postgresql_using="gin",
+    postgresql_ops={"first_name": "gin_trgm_ops"}
+)
+
+
 class Chat(Base):
     """Chat model."""
     __tablename__ = "chats"
@@ -113,6 +124,13 @@ class ChatMember(Base):
     chat: Mapped["Chat"] = relationship("Chat", back_populates="members")
 
 
+# Membership / chat-admin lookups by (chat, user) among active members
+Index(
+    "ix_chat_members_chat_user_left_at",
+    ChatMember.chat_id, ChatMember.user_id, ChatMember.left_at
+)
+
+
 class Task(Base):
     """Task model."""
     __tablename__ = "tasks"
@@ -160,6 +178,13 @@ class Task(Base):
         return self.status == TaskStatus.OPEN and datetime.utcnow() > self.deadline
 
 
+# Closed tasks of a user, newest first (/mytasks -> closed): index range scan + LIMIT
+Index(
+    "ix_tasks_assignee_status_closed_at",
+    Task.assignee_id, Task.status, Task.closed_at.desc()
+)
+
+
 class Expense(Base):
     """Expense model."""
     __tablename__ = "expenses"
@@ -239,3 +264,11 @@ class Message(Base):
     # Relationships
     chat: Mapped["Chat"] = relationship("Chat", back_populates="messages")
 
+
+
+# Due pending reminders (scheduler): partial index on Postgres, composite elsewhere
+Index(
+    "ix_reminders_pending_due",
+    Reminder.status, Reminder.remind_at,
+    postgresql_where=Reminder.status == ReminderStatus.PENDING
+)
@@ -2,7 +2,7 @@
 from telegram import Update
 from telegram.ext import (
     Application, CommandHandler, MessageHandler, 
-    CallbackQueryHandler, ConversationHandler, filters
+    CallbackQueryHandler, ChatMemberHandler, ConversationHandler, filters
 )
 
 from config import settings
@@ -34,7 +34,7 @@ def setup_handlers(app: Application) -> None:
     from handlers.start import (
         start_handler, help_handler, cancel_handler, app_handler,
         handle_new_chat_members, handle_left_chat_member,
-        handle_message
+        handle_chat_member_update, handle_message
     )
     from handlers.tasks import (
         get_task_conversation_handler,
@@ -157,6 +157,10 @@ def setup_handlers(app: Application) -> None:
         filters.StatusUpdate.LEFT_CHAT_MEMBER,
         handle_left_chat_member
     ))
+    app.add_handler(ChatMemberHandler(
+        handle_chat_member_update,
+        ChatMemberHandler.CHAT_MEMBER
+    ))
     
     # Sarcastic responses to reactions (group 1 to run alongside other handlers)
     app.add_handler(MessageHandler(
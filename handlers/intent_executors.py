@@ -212,6 +212,7 @@ async def _execute_reminder_creation(
     """
     from handlers.reminders import (
         _to_utc,
+        _wake_scheduler,
         _build_time_selection_keyboard,
         _compute_reminder_hash,
         _store_pending_reminder
@@ -285,6 +286,9 @@ async def _execute_reminder_creation(
             
             reply = await message.reply_text(response)
             reminder.confirmation_message_id = reply.message_id
+        
+        # Wake the scheduler only once the reminder row is committed
+        _wake_scheduler(context, reminder.remind_at)
             
     except Exception as e:
         logger.error(f"Error creating reminder from intent: {e}")
@@ -11,8 +11,9 @@ from sqlalchemy import select
 
 from database import get_session, Reminder, User, Chat, ReminderStatus
 from utils.date_parser import parse_reminder_time, DateParseError
-from utils.formatters import format_date, format_reminder_short
+from utils.formatters import format_date, format_reminder_list
 from utils.permissions import get_or_create_user, can_cancel_reminder
+from utils.ratelimit import send_throttled
 from config import settings
 
 logger = logging.getLogger(__name__)
@@ -24,6 +25,15 @@ def _to_utc(dt: datetime) -> datetime:
         return dt.astimezone(pytz.UTC).replace(tzinfo=None)
     return dt
 
+
+def _wake_scheduler(context: ContextTypes.DEFAULT_TYPE, remind_at: datetime) -> None:
+    """Make the scheduler check reminders at remind_at (naive UTC)."""
+    # Imported here: services.scheduler imports this module
+    from services.scheduler import schedule_reminder_check
+
+    if context.job_queue:
+        schedule_reminder_check(context.job_queue, remind_at)
+
 # Constants
 PENDING_HASH_MODULO = 10000
 
@@ -264,6 +274,9 @@ async def remind_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
         # Save confirmation message ID for editing/cancellation
         reminder.confirmation_message_id = reply.message_id
 
+    # Wake the scheduler only once the reminder row is committed
+    _wake_scheduler(context, reminder.remind_at)
+
 
 async def reminders_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle /reminders command - list active reminders."""
@@ -353,9 +366,8 @@ async def reminders_handler(update: Update, context: ContextTypes.DEFAULT_TYPE)
                 
                 lines.append(f'\nЧат "{chat_title}":')
                 
-                for reminder in chat_reminders:
-                    lines.append(f"{counter}. {format_reminder_short(reminder)}")
-                    counter += 1
+                lines.append(format_reminder_list(chat_reminders, counter))
+                counter += len(chat_reminders)
             
             keyboard = InlineKeyboardMarkup([
                 [InlineKeyboardButton(
@@ -456,6 +468,7 @@ async def _handle_time_selection(
             f'✅ Ок, напомню{recipient_text} {time_str}:\n"{pending["text"]}"'
         )
 
+    _wake_scheduler(context, reminder.remind_at)
     _delete_pending_reminder(context, reminder_hash)
     context.user_data.pop("reminder_waiting_time", None)
 
@@ -515,6 +528,7 @@ async def reminder_time_input_handler(
             f'✅ Ок, напомню{recipient_text} {time_str}:\n"{pending["text"]}"'
         )
 
+    _wake_scheduler(context, reminder.remind_at)
     _delete_pending_reminder(context, reminder_hash)
     context.user_data.pop("reminder_waiting_time", None)
 
@@ -603,94 +617,66 @@ async def _cancel_reminder(
 async def send_reminder(
     context: ContextTypes.DEFAULT_TYPE,
     reminder: Reminder
-) -> None:
+) -> bool:
     """Send a reminder notification (called by scheduler).
 
     Smart delivery: first try DM, then group chat if DM fails.
+    The reminder must be loaded with recipient, author and chat; no database
+    access happens here, the caller marks delivered reminders as sent.
+
+    Returns:
+        True if the reminder was delivered
     """
-    async with get_session() as session:
-        # Refresh reminder from DB
-        result = await session.execute(
-            select(Reminder).where(Reminder.id == reminder.id)
+    recipient = reminder.recipient
+    author = reminder.author
+    chat = reminder.chat
+    chat_title = chat.title if chat else "чат"
+
+    # Format message for DM (includes chat context)
+    if reminder.author_id != reminder.recipient_id:
+        dm_text = (
+            f"⏰ Напоминание из чата \"{chat_title}\":\n\n"
+            f"{reminder.text}\n\n"
+            f"(создал {author.display_name})"
         )
-        reminder = result.scalar_one_or_none()
-
-        if not reminder or reminder.status != ReminderStatus.PENDING:
-            return
-
-        # Get recipient and author
-        result = await session.execute(
-            select(User).where(User.id == reminder.recipient_id)
+    else:
+        dm_text = (
+            f"⏰ Напоминание из чата \"{chat_title}\":\n\n"
+            f"{reminder.text}"
         )
-        recipient = result.scalar_one()
 
-        result = await session.execute(
-            select(User).where(User.id == reminder.author_id)
+    # Format message for group chat
+    if reminder.author_id != reminder.recipient_id:
+        group_text = (
+            f"⏰ {recipient.display_name}, напоминаю: {reminder.text}\n"
+            f"(создал {author.display_name})"
         )
-        author = result.scalar_one()
+    else:
+        group_text = f"⏰ {recipient.display_name}, напоминаю: {reminder.text}"
 
-        # Get chat for context
-        result = await session.execute(
-            select(Chat).where(Chat.id == reminder.chat_id)
+    # Try DM first
+    try:
+        await send_throttled(context.bot, recipient.id, text=dm_text)
+        logger.debug("Reminder %s sent to DM of user %s", reminder.id, recipient.id)
+        return True
+    except Exception as e:
+        logger.debug(
+            "Failed to send reminder %s to DM of user %s: %s",
+            reminder.id, recipient.id, e
         )
-        chat = result.scalar_one_or_none()
-        chat_title = chat.title if chat else "чат"
-
-        # Format message for DM (includes chat context)
-        if reminder.author_id != reminder.recipient_id:
-            dm_text = (
-                f"⏰ Напоминание из чата \"{chat_title}\":\n\n"
-                f"{reminder.text}\n\n"
-                f"(создал {author.display_name})"
-            )
-        else:
-            dm_text = (
-                f"⏰ Напоминание из чата \"{chat_title}\":\n\n"
-                f"{reminder.text}"
-            )
-
-        # Format message for group chat
-        if reminder.author_id != reminder.recipient_id:
-            group_text = (
-                f"⏰ {recipient.display_name}, напоминаю: {reminder.text}\n"
-                f"(создал {author.display_name})"
-            )
-        else:
-            group_text = f"⏰ {recipient.display_name}, напоминаю: {reminder.text}"
-
-        # Try DM first
-        dm_sent = False
-        try:
-            await context.bot.send_message(
-                chat_id=recipient.id,
-                text=dm_text
-            )
-            dm_sent = True
-            logger.debug("Reminder %s sent to DM of user %s", reminder.id, recipient.id)
-        except Exception as e:
-            logger.debug(
-                "Failed to send reminder %s to DM of user %s: %s",
-                reminder.id, recipient.id, e
-            )
 
-        # If DM failed, send to group
-        if not dm_sent:
-            try:
-                await context.bot.send_message(
-                    chat_id=reminder.chat_id,
-                    text=group_text
-                )
-                logger.debug(
-                    "Reminder %s sent to group chat %s",
-                    reminder.id, reminder.chat_id
-                )
-            except Exception as e:
-                logger.debug(
-                    "Failed to send reminder %s to chat %s: %s",
-                    reminder.id, reminder.chat_id, e
-                )
-                return
-
-        reminder.status = ReminderStatus.SENT
-        reminder.sent_at = datetime.utcnow()
+    # If DM failed, send to group
+    try:
+        await send_throttled(context.bot, reminder.chat_id, text=group_text)
+        logger.debug(
+            "Reminder %s sent to group chat %s",
+            reminder.id, reminder.chat_id
+        )
+        return True
+    except Exception as e:
+        logger.debug(
+            "Failed to send reminder %s to chat %s: %s",
+            reminder.id, reminder.chat_id, e
+        )
+        return False
 
@@ -125,9 +125,6 @@ async def handle_new_chat_members(update: Update, context: ContextTypes.DEFAULT_
     chat = update.effective_chat
     bot_id = context.bot.id
 
-    # Invalidate members cache
-    invalidate_cache(chat.id)
-
     async with get_session() as session:
         # Check if bot was added
         for member in update.message.new_chat_members:
@@ -178,6 +175,9 @@ async def handle_new_chat_members(update: Update, context: ContextTypes.DEFAULT_
                     )
                     session.add(chat_member)
 
+    # Invalidate members cache once the changes are committed
+    invalidate_cache(chat.id)
+
 
 async def handle_left_chat_member(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle when members leave chat."""
@@ -188,9 +188,6 @@ async def handle_left_chat_member(update: Update, context: ContextTypes.DEFAULT_
     left_member = update.message.left_chat_member
     bot_id = context.bot.id
 
-    # Invalidate members cache
-    invalidate_cache(chat.id)
-
     async with get_session() as session:
         if left_member.id == bot_id:
             # Bot was removed
@@ -212,6 +209,15 @@ async def handle_left_chat_member(update: Update, context: ContextTypes.DEFAULT_
             if chat_member:
                 chat_member.left_at = datetime.utcnow()
 
+    # Invalidate members cache once the changes are committed
+    invalidate_cache(chat.id)
+
+
+async def handle_chat_member_update(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Handle chat member status changes (join, leave, kick, promote)."""
+    if update.chat_member:
+        invalidate_cache(update.chat_member.chat.id)
+
 
 async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Store messages for summarization."""
@@ -249,6 +255,8 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
             first_name=user.first_name,
             last_name=user.last_name
         )
+        # Check before the next query: its autoflush clears the dirty state
+        user_changed = db_user in session.dirty
         
         # Ensure chat membership
         result = await session.execute(
@@ -258,6 +266,9 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
             )
         )
         membership = result.scalar_one_or_none()
+        members_changed = (
+            not membership or membership.left_at is not None or user_changed
+        )
         
         if not membership:
             membership = ChatMember(
@@ -278,3 +289,6 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
         )
         session.add(message)
 
+    if members_changed:
+        invalidate_cache(chat.id)
+
@@ -10,7 +10,7 @@ from sqlalchemy import select
 from database import get_session, Message, Chat, Subscription, User, ChatMember
 from utils.formatters import truncate_summary
 from utils.permissions import get_or_create_user, is_admin
-from llm.summarizer import summarize_messages
+from llm.summarizer import summarize_messages, summarize_many
 
 logger = logging.getLogger(__name__)
 
@@ -370,41 +370,53 @@ async def send_daily_summaries(context: ContextTypes.DEFAULT_TYPE) -> None:
                 by_user[admin.id] = []
             by_user[admin.id] = list(set(by_user[admin.id] + admin_chats))
 
+        # Load each chat once: users often share the same chats
+        chat_titles: dict[int, str] = {}
+        formatted_by_chat: dict[int, list[str]] = {}
+        all_chat_ids = {chat_id for chat_ids in by_user.values() for chat_id in chat_ids}
+
+        if all_chat_ids:
+            result = await session.execute(
+                select(Chat).where(Chat.id.in_(all_chat_ids), Chat.is_active == True)
+            )
+            chat_titles = {chat.id: chat.title for chat in result.scalars().all()}
+
+        for chat_id in chat_titles:
+            # Get messages
+            result = await session.execute(
+                select(Message)
+                .where(
+                    Message.chat_id == chat_id,
+                    Message.is_bot_command == False,
+                    Message.created_at >= cutoff
+                )
+                .order_by(Message.created_at)
+            )
+            messages = result.scalars().all()
+            if messages:
+                # Format messages for summarization
+                formatted_by_chat[chat_id] = await _format_messages_for_summary(session, messages)
+
+        # Generate summaries concurrently, one per chat
+        summaries = dict(zip(
+            formatted_by_chat,
+            await summarize_many(list(formatted_by_chat.values()))
+        ))
+
         for user_id, chat_ids in by_user.items():
             lines = [f"📊 Саммари за {today}:\n"]
 
             for chat_id in chat_ids:
-                result = await session.execute(
-                    select(Chat).where(Chat.id == chat_id)
-                )
-                chat = result.scalar_one_or_none()
-                if not chat or not chat.is_active:
+                if chat_id not in chat_titles:
                     continue
 
-                # Get messages
-                result = await session.execute(
-                    select(Message)
-                    .where(
-                        Message.chat_id == chat_id,
-                        Message.is_bot_command == False,
-                        Message.created_at >= cutoff
-                    )
-                    .order_by(Message.created_at)
-                )
-                messages = result.scalars().all()
-
-                lines.append(f"📁 {chat.title}:")
+                lines.append(f"📁 {chat_titles[chat_id]}:")
 
-                if not messages:
+                if chat_id not in summaries:
                     lines.append(f"{MSG_NO_MESSAGES}\n")
                     continue
 
-                # Format messages for summarization
-                formatted = await _format_messages_for_summary(session, messages)
-
-                # Generate summary
-                summary = await summarize_messages(formatted)
-                lines.append(summary + "\n")
+                lines.append(summaries[chat_id] + "\n")
 
             if len(lines) > 1:  # Has at least one chat
                 response = "\n".join(lines)
@@ -1,7 +1,8 @@
 """Task management handlers."""
+import asyncio
 import logging
 import re
-from datetime import datetime, date, timedelta
+from datetime import datetime, date, timedelta, timezone
 from typing import Optional, TypedDict
 
 import pytz
@@ -12,12 +13,15 @@ from telegram.ext import (
     MessageHandler, CallbackQueryHandler, filters
 )
 from sqlalchemy import select, and_
+from sqlalchemy.orm import selectinload
 
 from database import get_session, Task, User, Chat, ChatMember, TaskStatus
 from database.models import RecurrenceType
 from handlers.base import States
+from handlers.reminders import _wake_scheduler
 from llm.client import ask_llm
 from utils.date_parser import parse_deadline, DateParseError
+from utils.cache import invalidate_cache
 from utils.formatters import format_task, format_task_short, format_date
 from utils.permissions import (
     get_or_create_user, is_admin, can_close_task, can_edit_task,
@@ -28,9 +32,23 @@ from config import settings
 
 logger = logging.getLogger(__name__)
 
+UTC = timezone.utc
+
+
+def _utcnow() -> datetime:
+    """Current UTC time as naive datetime (DB columns store naive UTC)."""
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
 # Constants
 MAX_USER_BUTTONS = 5
 TASKS_PER_PAGE = 8
+TELEGRAM_MESSAGE_LIMIT = 4096
+CHAT_NOTIFY_DELAY = 1.5  # seconds to collect close notifications per chat
+
+# Buffered chat notifications: chat_id -> pending lines
+_pending_chat_notifications: dict[int, list[str]] = {}
+_flush_tasks: set = set()  # keep references to running flush tasks
 
 # Message constants
 MSG_GROUP_ONLY = "Эта команда работает только в групповых чатах"
@@ -110,6 +128,36 @@ DAY_MAP = {
 SELF_KEYWORDS = ["я", "мне", "себе", "сам", "сама", "себя"]
 SELF_PHRASES = ["мне ", "мне,", "себе ", "я должен", "я должна", "мне нужно", "мне надо"]
 
+# Precompiled keyword alternations: one pass over the text instead of a
+# separate `in` scan per literal. Longest literals go first so that the
+# alternation prefers them at a given position.
+# Ranked by (type index, pattern index) so the earliest pattern in
+# RECURRENCE_PATTERNS order wins, as with a sequential scan.
+RECURRENCE_PRIORITY = {
+    pattern: ((type_index, pattern_index), recurrence)
+    for type_index, (recurrence, patterns) in enumerate(RECURRENCE_PATTERNS.items())
+    for pattern_index, pattern in enumerate(patterns)
+}
+RECURRENCE_RE = re.compile(
+    "|".join(map(re.escape, sorted(RECURRENCE_PRIORITY, key=len, reverse=True)))
+)
+DAY_RE = re.compile("|".join(DAY_MAP))
+SELF_PHRASES_RE = re.compile("|".join(map(re.escape, SELF_PHRASES)))
+
+# Username patterns: bare or @-prefixed value, and explicit @mention
+USERNAME_RE = re.compile(r"@?(\w+)")
+MENTION_RE = re.compile(r"@(\w+)")
+
+# Inline /edit keywords -> edited field
+EDIT_KEYWORD_FIELDS = {
+    "дедлайн": "deadline",
+    "срок": "deadline",
+    "исполнитель": "assignee",
+    "текст": "text",
+}
+# Keywords must start a word: "текст" inside "контекст" is part of the value
+EDIT_KEYWORDS_RE = re.compile(r"\b(" + "|".join(EDIT_KEYWORD_FIELDS) + ")")
+
 
 def _build_recurrence_keyboard() -> InlineKeyboardMarkup:
     """Build inline keyboard for recurrence selection."""
@@ -189,14 +237,25 @@ def _parse_time_from_text(text: str) -> tuple[int, int]:
     return None, None
 
 
+def _match_recurrence(text: str) -> Optional[tuple[RecurrenceType, str]]:
+    """Find recurrence type and the matched pattern in text."""
+    hits = {m.group(0) for m in RECURRENCE_RE.finditer(text.lower())}
+    if not hits:
+        return None
+    pattern = min(hits, key=lambda hit: RECURRENCE_PRIORITY[hit][0])
+    return RECURRENCE_PRIORITY[pattern][1], pattern
+
+
 def _detect_recurrence(text: str) -> Optional[RecurrenceType]:
     """Detect recurrence type from text."""
-    text_lower = text.lower()
-    for recurrence, patterns in RECURRENCE_PATTERNS.items():
-        for pattern in patterns:
-            if pattern in text_lower:
-                return recurrence
-    return None
+    match = _match_recurrence(text)
+    return match[0] if match else None
+
+
+def _detect_weekday(text: str) -> Optional[int]:
+    """Detect weekday (Monday = 0) mentioned in lowercased text."""
+    hits = [DAY_MAP[m.group(0)] for m in DAY_RE.finditer(text)]
+    return min(hits) if hits else None
 
 
 def _calculate_next_weekday(target_weekday: int, base_date: date = None) -> date:
@@ -211,11 +270,7 @@ def _calculate_next_weekday(target_weekday: int, base_date: date = None) -> date
 
 def _is_self_assignment(text: str) -> bool:
     """Check if text indicates self-assignment."""
-    text_lower = text.lower()
-    for phrase in SELF_PHRASES:
-        if phrase in text_lower:
-            return True
-    return False
+    return SELF_PHRASES_RE.search(text.lower()) is not None
 
 
 async def _get_chat_members(session, chat_id: int) -> list[User]:
@@ -377,7 +432,7 @@ def _parse_llm_task_response(response: str, members: list[User]) -> dict:
             if assignee == "я":
                 result["is_self"] = True
             elif "@" in assignee:
-                username_match = re.search(r"@(\w+)", assignee)
+                username_match = MENTION_RE.search(assignee)
                 if username_match:
                     username = username_match.group(1)
                     for m in members:
@@ -514,25 +569,22 @@ def _parse_recurrence_fallback(text: str, result: ParsedTask) -> ParsedTask:
             return result
 
     # Regular recurrence patterns
-    detected = _detect_recurrence(text)
-    if detected:
+    match = _match_recurrence(text)
+    if match:
+        detected, pattern = match
         result["recurrence"] = detected
 
         # Remove pattern from task text
-        for pattern in RECURRENCE_PATTERNS.get(detected, []):
-            if pattern in text_lower:
-                result["task"] = re.sub(rf"(?i){pattern}", "", result["task"]).strip()
-                break
+        result["task"] = re.sub(rf"(?i){re.escape(pattern)}", "", result["task"]).strip()
 
         # Calculate deadline for weekly tasks
         if detected == RecurrenceType.WEEKLY:
-            for day_name, weekday in DAY_MAP.items():
-                if day_name in text_lower:
-                    next_date = _calculate_next_weekday(weekday)
-                    result["deadline"] = datetime.combine(
-                        next_date, datetime.min.time().replace(hour=12)
-                    )
-                    break
+            weekday = _detect_weekday(text_lower)
+            if weekday is not None:
+                next_date = _calculate_next_weekday(weekday)
+                result["deadline"] = datetime.combine(
+                    next_date, datetime.min.time().replace(hour=12)
+                )
 
         # Default deadline
         if not result["deadline"]:
@@ -546,7 +598,7 @@ def _parse_recurrence_fallback(text: str, result: ParsedTask) -> ParsedTask:
 
 async def _parse_username_fallback(text: str, result: ParsedTask) -> ParsedTask:
     """Parse @username from text (fallback)."""
-    username_match = re.search(r"@(\w+)", text)
+    username_match = MENTION_RE.search(text)
     if username_match:
         username = username_match.group(1)
         async with get_session() as session:
@@ -587,7 +639,7 @@ async def _llm_find_assignee_fallback(
         for line in response.split("\n"):
             if "ИСПОЛНИТЕЛЬ:" in line.upper():
                 if "несколько" in line.lower() or "," in line:
-                    usernames = re.findall(r"@(\w+)", line)
+                    usernames = MENTION_RE.findall(line)
                     if len(usernames) > 1:
                         result["multiple_candidates"] = []
                         for username in usernames:
@@ -600,7 +652,7 @@ async def _llm_find_assignee_fallback(
                                     })
                                     break
                 else:
-                    match = re.search(r"@(\w+)", line)
+                    match = MENTION_RE.search(line)
                     if match:
                         username = match.group(1)
                         for m in members:
@@ -810,7 +862,7 @@ async def receive_task_assignee(update: Update, context: ContextTypes.DEFAULT_TY
                 return States.TASK_DEADLINE
 
     # Check @username
-    username_match = re.search(r"@(\w+)", text)
+    username_match = MENTION_RE.search(text)
 
     async with get_session() as session:
         if username_match:
@@ -858,7 +910,7 @@ async def receive_task_assignee(update: Update, context: ContextTypes.DEFAULT_TY
                 ])
 
                 response = await _llm_match_name(text, members_list)
-                found_match = re.search(r"@(\w+)", response)
+                found_match = MENTION_RE.search(response)
 
                 if found_match:
                     username = found_match.group(1)
@@ -897,6 +949,7 @@ async def receive_task_assignee(update: Update, context: ContextTypes.DEFAULT_TY
                     if not existing.scalar_one_or_none():
                         session.add(ChatMember(chat_id=chat_id, user_id=user.id))
                         await session.commit()
+                        invalidate_cache(chat_id)
 
                 context.user_data["task_assignee_id"] = user.id
                 context.user_data["task_assignee_username"] = user.username or potential_username
@@ -968,11 +1021,7 @@ async def receive_task_deadline(update: Update, context: ContextTypes.DEFAULT_TY
     detected_recurrence = _detect_recurrence(text)
 
     if detected_recurrence:
-        target_weekday = None
-        for day_name, weekday in DAY_MAP.items():
-            if day_name in text:
-                target_weekday = weekday
-                break
+        target_weekday = _detect_weekday(text)
 
         default_hour = _detect_time_of_day(text)
         hour, minute = _parse_time_from_text(text)
@@ -1053,6 +1102,7 @@ async def _create_task(update: Update, context: ContextTypes.DEFAULT_TYPE) -> in
             context.user_data.clear()
             return ConversationHandler.END
 
+        # Write the row before confirming anything in chat
         task = Task(
             chat_id=chat_id,
             author_id=author_id,
@@ -1068,6 +1118,13 @@ async def _create_task(update: Update, context: ContextTypes.DEFAULT_TYPE) -> in
         result = await session.execute(select(User).where(User.id == assignee_id))
         assignee = result.scalar_one()
 
+        # Chat title for the DM, loaded before the task is modified again
+        # (a query after that would autoflush a separate UPDATE)
+        chat = None
+        if assignee_id != author_id:
+            result = await session.execute(select(Chat).where(Chat.id == chat_id))
+            chat = result.scalar_one()
+
         deadline_str = format_date(deadline)
         recurrence_display = ""
         if recurrence != RecurrenceType.NONE:
@@ -1086,14 +1143,12 @@ async def _create_task(update: Update, context: ContextTypes.DEFAULT_TYPE) -> in
         else:
             reply = await update.message.reply_text(confirmation)
 
+        # confirmation_message_id and is_delivered go out in one UPDATE at commit
         task.confirmation_message_id = reply.message_id
 
         # Notify assignee in DM
-        if assignee_id != author_id:
+        if chat is not None:
             try:
-                result = await session.execute(select(Chat).where(Chat.id == chat_id))
-                chat = result.scalar_one()
-
                 dm_text = (
                     f"📌 Новая задача!\n\n"
                     f'"{text}"\n'
@@ -1124,7 +1179,7 @@ async def _create_task(update: Update, context: ContextTypes.DEFAULT_TYPE) -> in
 
 def _sort_tasks_by_urgency(tasks: list[Task]) -> list[Task]:
     """Sort tasks by urgency: overdue -> today -> by deadline -> no deadline."""
-    now = datetime.utcnow()
+    now = _utcnow()
     today = now.date()
 
     def sort_key(task: Task):
@@ -1196,7 +1251,7 @@ async def tasks_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
         if current_filter == "my":
             query = query.where(Task.assignee_id == user_id)
         elif current_filter == "overdue":
-            query = query.where(Task.deadline < datetime.utcnow())
+            query = query.where(Task.deadline < _utcnow())
 
         result = await session.execute(query)
         tasks = list(result.scalars().all())
@@ -1214,7 +1269,7 @@ async def tasks_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> N
         tasks = _sort_tasks_by_urgency(tasks)
 
         # Build response
-        now = datetime.utcnow()
+        now = _utcnow()
         lines = ["📋 Активные задачи:\n"]
 
         for i, task in enumerate(tasks[:10], 1):
@@ -1460,7 +1515,7 @@ async def done_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
             return
 
         task.status = TaskStatus.CLOSED
-        task.closed_at = datetime.utcnow()
+        task.closed_at = _utcnow()
         task.closed_by = user_id
 
         next_task = await _create_next_recurring_task(session, task)
@@ -1622,6 +1677,19 @@ async def edit_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> in
         return ConversationHandler.END
 
 
+def _split_edit_args(args: str) -> dict[str, str]:
+    """Split /edit arguments into field values by keyword spans (single pass)."""
+    spans = [
+        (m.start(), m.end(), EDIT_KEYWORD_FIELDS[m.group(1)])
+        for m in EDIT_KEYWORDS_RE.finditer(args.lower())
+    ]
+    fields = {}
+    for i, (_, end, field) in enumerate(spans):
+        next_start = spans[i + 1][0] if i + 1 < len(spans) else len(args)
+        fields.setdefault(field, args[end:next_start].strip().strip("-").strip())
+    return fields
+
+
 async def _process_inline_edit(
     update: Update,
     context: ContextTypes.DEFAULT_TYPE,
@@ -1630,34 +1698,23 @@ async def _process_inline_edit(
     args: str
 ) -> int:
     """Process inline edit command with smart parsing."""
-    args_lower = args.lower()
     args_clean = args.strip().strip("-").strip()  # Remove leading/trailing dashes
     changes = []
 
     # Check for explicit keywords first
-    if "дедлайн" in args_lower or "срок" in args_lower:
-        # Extract deadline text after keyword
-        for keyword in ["дедлайн", "срок"]:
-            if keyword in args_lower:
-                deadline_text = args_lower.split(keyword, 1)[1].strip()
-                deadline_text = deadline_text.strip("-").strip()  # Remove dashes
-                for kw in ["исполнитель", "текст"]:
-                    if kw in deadline_text:
-                        deadline_text = deadline_text.split(kw)[0].strip()
-                break
+    fields = _split_edit_args(args)
 
+    if "deadline" in fields:
         try:
-            new_deadline = parse_deadline(deadline_text)
+            new_deadline = parse_deadline(fields["deadline"])
             task.deadline = new_deadline
             changes.append(f"📅 Дедлайн: {format_date(new_deadline, include_time=True)}")
         except DateParseError as e:
             await update.message.reply_text(f"Ошибка в дедлайне: {e}")
             return ConversationHandler.END
 
-    elif "исполнитель" in args_lower:
-        assignee_text = args_lower.split("исполнитель", 1)[1].strip()
-        assignee_text = assignee_text.strip("-").strip()
-        username_match = re.search(r"@?(\w+)", assignee_text)
+    elif "assignee" in fields:
+        username_match = USERNAME_RE.search(fields["assignee"])
 
         if username_match:
             username = username_match.group(1)
@@ -1670,14 +1727,8 @@ async def _process_inline_edit(
                 await update.message.reply_text(MSG_USER_NOT_FOUND)
                 return ConversationHandler.END
 
-    elif "текст" in args_lower:
-        text_idx = args.lower().find("текст")
-        new_text = args[text_idx + 5:].strip()
-
-        for keyword in ["дедлайн", "срок", "исполнитель"]:
-            if keyword in new_text.lower():
-                new_text = new_text[:new_text.lower().find(keyword)].strip()
-
+    elif "text" in fields:
+        new_text = fields["text"]
         if new_text:
             task.text = new_text[:settings.max_task_length]
             changes.append(f'Новый текст: "{task.text}"')
@@ -1703,7 +1754,7 @@ async def _process_inline_edit(
             else:
                 # Not a deadline, try to find assignee
                 # Check for @username
-                username_match = re.search(r"@(\w+)", args_clean)
+                username_match = MENTION_RE.search(args_clean)
                 if username_match:
                     username = username_match.group(1)
                     new_assignee = await _find_user_by_username(session, username)
@@ -1793,6 +1844,7 @@ async def _process_reminder_edit(
         # Save new confirmation_message_id so commands work on this message
         reminder.confirmation_message_id = reply.message_id
         await session.commit()
+        _wake_scheduler(context, new_time)
         
         context.user_data.clear()
         return ConversationHandler.END
@@ -1844,7 +1896,7 @@ async def receive_edit_value(update: Update, context: ContextTypes.DEFAULT_TYPE)
                 return States.EDIT_VALUE
 
         elif field == "assignee":
-            username_match = re.search(r"@?(\w+)", value)
+            username_match = USERNAME_RE.search(value)
             if username_match:
                 username = username_match.group(1)
                 new_assignee = await _find_user_by_username(session, username)
@@ -2002,7 +2054,7 @@ async def _mytasks_close_task(
         
         # Close the task
         task.status = TaskStatus.CLOSED
-        task.closed_at = datetime.utcnow()
+        task.closed_at = _utcnow()
         task.closed_by = user_id
         
         # Create next recurring task if needed
@@ -2259,7 +2311,7 @@ async def tasks_filter_callback(update: Update, context: ContextTypes.DEFAULT_TY
         if filter_type == "my":
             query_obj = query_obj.where(Task.assignee_id == user_id)
         elif filter_type == "overdue":
-            query_obj = query_obj.where(Task.deadline < datetime.utcnow())
+            query_obj = query_obj.where(Task.deadline < _utcnow())
 
         result = await session.execute(query_obj)
         tasks = list(result.scalars().all())
@@ -2275,7 +2327,7 @@ async def tasks_filter_callback(update: Update, context: ContextTypes.DEFAULT_TY
             return
 
         tasks = _sort_tasks_by_urgency(tasks)
-        now = datetime.utcnow()
+        now = _utcnow()
         lines = ["📋 Активные задачи:\n"]
 
         for i, task in enumerate(tasks[:10], 1):
@@ -2446,7 +2498,7 @@ async def _delete_single_task(
 
         # Close task (mark as deleted by deactivating recurrence)
         task.status = TaskStatus.CLOSED
-        task.closed_at = datetime.utcnow()
+        task.closed_at = _utcnow()
         task.closed_by = user_id
         task.recurrence_active = False
 
@@ -2490,7 +2542,7 @@ async def _delete_task_series(
         # Close all tasks in series
         for t in series_tasks:
             t.status = TaskStatus.CLOSED
-            t.closed_at = datetime.utcnow()
+            t.closed_at = _utcnow()
             t.closed_by = user_id
             t.recurrence_active = False
 
@@ -2511,7 +2563,11 @@ async def _close_task_callback(
     chat_id = update.effective_chat.id
 
     async with get_session() as session:
-        result = await session.execute(select(Task).where(Task.id == task_id))
+        # Preload assignee: the closer is usually the assignee, so the
+        # lookup below is served from the identity map
+        result = await session.execute(
+            select(Task).options(selectinload(Task.assignee)).where(Task.id == task_id)
+        )
         task = result.scalar_one_or_none()
 
         if not task:
@@ -2527,13 +2583,12 @@ async def _close_task_callback(
             return
 
         task.status = TaskStatus.CLOSED
-        task.closed_at = datetime.utcnow()
+        task.closed_at = _utcnow()
         task.closed_by = user_id
 
         next_task = await _create_next_recurring_task(session, task)
 
-        result = await session.execute(select(User).where(User.id == user_id))
-        closer = result.scalar_one()
+        closer = await session.get(User, user_id)
 
         # Check if this is from task list (message contains "Активные задачи")
         message_text = query.message.text or ""
@@ -2543,7 +2598,7 @@ async def _close_task_callback(
             # Update task list instead of replacing message
             current_filter = context.user_data.get("tasks_filter", "all")
             
-            query_obj = select(Task).where(
+            query_obj = select(Task).options(selectinload(Task.assignee)).where(
                 Task.chat_id == chat_id,
                 Task.status == TaskStatus.OPEN
             )
@@ -2551,7 +2606,7 @@ async def _close_task_callback(
             if current_filter == "my":
                 query_obj = query_obj.where(Task.assignee_id == user_id)
             elif current_filter == "overdue":
-                query_obj = query_obj.where(Task.deadline < datetime.utcnow())
+                query_obj = query_obj.where(Task.deadline < _utcnow())
 
             result = await session.execute(query_obj)
             tasks = list(result.scalars().all())
@@ -2567,16 +2622,12 @@ async def _close_task_callback(
                 await query.edit_message_text(text)
             else:
                 # Rebuild task list
-                now = datetime.utcnow()
+                now = _utcnow()
                 lines = ["📋 Активные задачи:\n"]
 
                 for i, t in enumerate(tasks[:10], 1):
                     if t.assignee_id:
-                        result = await session.execute(
-                            select(User).where(User.id == t.assignee_id)
-                        )
-                        assignee = result.scalar_one_or_none()
-                        assignee_name = assignee.display_name if assignee else "?"
+                        assignee_name = t.assignee.display_name if t.assignee else "?"
                     else:
                         assignee_name = "—"
 
@@ -2614,15 +2665,44 @@ async def _close_task_callback(
         # Notify in chat only if this is a callback from task list (not from task details)
         # Check if we're in a group chat and the message is different from the one we just edited
         if update.effective_chat.type != "private":
-            try:
-                # Only send notification if the closed task was from a different message
-                # (i.e., closed from task list, not from task details message)
-                chat_msg = f'✅ {closer.display_name} закрыл задачу "{task.text}"'
-                if next_task:
-                    chat_msg += f"\n🔄 Следующая: {format_date(next_task.deadline)}"
-                await context.bot.send_message(chat_id=task.chat_id, text=chat_msg)
-            except Exception as e:
-                logger.debug(f"Failed to notify chat about closed task: {e}")
+            # Only send notification if the closed task was from a different message
+            # (i.e., closed from task list, not from task details message)
+            chat_msg = f'✅ {closer.display_name} закрыл задачу "{task.text}"'
+            if next_task:
+                chat_msg += f"\n🔄 Следующая: {format_date(next_task.deadline)}"
+            _queue_chat_notification(context.bot, task.chat_id, chat_msg)
+
+
+def _queue_chat_notification(bot, chat_id: int, text: str) -> None:
+    """Buffer chat notification; closures within CHAT_NOTIFY_DELAY go out as one message."""
+    pending = _pending_chat_notifications.get(chat_id)
+    if pending is not None:
+        pending.append(text)
+        return
+
+    _pending_chat_notifications[chat_id] = [text]
+    flush = asyncio.create_task(_flush_chat_notifications(bot, chat_id))
+    _flush_tasks.add(flush)
+    flush.add_done_callback(_flush_tasks.discard)
+
+
+async def _flush_chat_notifications(bot, chat_id: int) -> None:
+    """Send buffered notifications for a chat, split by Telegram message limit."""
+    await asyncio.sleep(CHAT_NOTIFY_DELAY)
+    lines = _pending_chat_notifications.pop(chat_id, [])
+
+    chunks = []
+    for line in lines:
+        if chunks and len(chunks[-1]) + len(line) + 1 <= TELEGRAM_MESSAGE_LIMIT:
+            chunks[-1] += "\n" + line
+        else:
+            chunks.append(line[:TELEGRAM_MESSAGE_LIMIT])
+
+    for chunk in chunks:
+        try:
+            await bot.send_message(chat_id=chat_id, text=chunk)
+        except Exception as e:
+            logger.debug(f"Failed to notify chat about closed task: {e}")
 
 
 async def _show_closed_tasks(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -2630,7 +2710,7 @@ async def _show_closed_tasks(update: Update, context: ContextTypes.DEFAULT_TYPE)
     query = update.callback_query
     user_id = update.effective_user.id
 
-    cutoff = datetime.utcnow() - timedelta(days=settings.closed_tasks_retention_days)
+    cutoff = _utcnow() - timedelta(days=settings.closed_tasks_retention_days)
 
     async with get_session() as session:
         result = await session.execute(
@@ -2646,20 +2726,20 @@ async def _show_closed_tasks(update: Update, context: ContextTypes.DEFAULT_TYPE)
         tasks = result.scalars().all()
 
         if not tasks:
-            await query.message.reply_text("Нет закрытых задач за последние 30 дней")
+            await query.edit_message_text("Нет закрытых задач за последние 30 дней")
             return
 
-        lines = ["📋 Закрытые задачи:\n"]
+        chat_ids = list(set(t.chat_id for t in tasks))
+        result = await session.execute(select(Chat).where(Chat.id.in_(chat_ids)))
+        chat_titles = {c.id: c.title for c in result.scalars().all()}
 
-        for task in tasks:
-            result = await session.execute(select(Chat).where(Chat.id == task.chat_id))
-            chat = result.scalar_one_or_none()
-            chat_title = chat.title if chat else "Неизвестный чат"
-
-            closed_str = format_date(task.closed_at)
-            lines.append(f"✓ {task.text}\n  Чат: {chat_title} | Закрыта: {closed_str}\n")
-
-        await query.message.reply_text("\n".join(lines))
+        body = "\n".join(
+            f"✓ {task.text}\n"
+            f"  Чат: {chat_titles.get(task.chat_id, 'Неизвестный чат')} | "
+            f"Закрыта: {format_date(task.closed_at)}\n"
+            for task in tasks
+        )
+        await query.edit_message_text("📋 Закрытые задачи:\n\n" + body)
 
 
 # --- Conversation Handlers ---
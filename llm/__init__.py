@@ -1,5 +1,5 @@
 """LLM integration package."""
-from llm.summarizer import summarize_messages
+from llm.summarizer import summarize_messages, summarize_many
 
-__all__ = ["summarize_messages"]
+__all__ = ["summarize_messages", "summarize_many"]
 
@@ -1,6 +1,12 @@
 """LLM client for general questions - supports OpenAI and YandexGPT."""
+import hashlib
 import httpx
-import random
+import orjson
+import re
+import time
+from functools import cache
+from random import choice
+from typing import Iterable
 from openai import AsyncOpenAI
 
 from config import settings
@@ -53,19 +59,125 @@ SYSTEM_PROMPT = """Ты — Толян, 35 лет. Мужик, который к
 - Веришь в систему и дисциплину, а не в магию"""
 
 
-# OpenAI client cache
-_openai_client = None
+# In-memory response cache: prompt digest -> (answer, cached_at)
+_response_cache: dict[bytes, tuple[str, float]] = {}
+RESPONSE_CACHE_TTL = 300  # 5 minutes
+RESPONSE_CACHE_MAX_SIZE = 1024
+MAX_CACHED_TEMPERATURE = 0.5
 
 
+@cache
 def get_openai_client() -> AsyncOpenAI:
     """Get or create OpenAI client."""
-    global _openai_client
-    if _openai_client is None:
-        _openai_client = AsyncOpenAI(
-            api_key=settings.openai_api_key,
-            base_url=settings.openai_base_url if settings.openai_base_url else None
-        )
-    return _openai_client
+    return AsyncOpenAI(
+        api_key=settings.openai_api_key,
+        base_url=settings.openai_base_url if settings.openai_base_url else None
+    )
+
+
+@cache
+def get_yandex_client() -> httpx.AsyncClient:
+    """Get or create shared HTTP client for YandexGPT (keeps connections alive)."""
+    return httpx.AsyncClient(
+        timeout=30.0,
+        limits=httpx.Limits(max_keepalive_connections=20),
+    )
+
+
+async def close_clients() -> None:
+    """Close shared LLM HTTP clients (call on shutdown)."""
+    if get_yandex_client.cache_info().currsize:
+        await get_yandex_client().aclose()
+        get_yandex_client.cache_clear()
+
+
+# Standard YandexGPT refusal phrases
+REFUSAL_PHRASES = (
+    "Я не могу обсуждать эту тему",
+    "Я не могу обсудить эту тему",
+    "Давайте поговорим о чём-нибудь ещё",
+    "Давайте сменим тему"
+)
+
+# Standard refusals are ~50-80 chars; longer responses are never scanned
+MAX_REFUSAL_LENGTH = 200
+
+# Political/army/power topics
+POLITICAL_KEYWORDS = (
+    'путин', 'война', 'армия', 'военн', 'донбас', 'украин', 
+    'выбор', 'политик', 'власть', 'президент', 'правительств',
+    'мобилизац', 'сво', 'нато', 'санкци'
+)
+
+# Insults/provocations
+INSULT_KEYWORDS = (
+    'пидор', 'пидар', 'хуй', 'хуе', 'пизд', 'ебан', 'ебл', 
+    'мудак', 'дебил', 'идиот', 'долбоёб', 'уёб', 'гандон',
+    'говно', 'дерьмо', 'сука', 'блядь', 'еблан'
+)
+
+# Simple name-calling (softer answer than aggressive provocation)
+SIMPLE_INSULT_KEYWORDS = ('пидор', 'пидар', 'дебил', 'идиот', 'дурак', 'тупой')
+
+
+# Tolyan-style replacements for YandexGPT refusals
+POLITICAL_RESPONSES = (
+    "Бро, завязывай с этой темой. Меня за такое могут вырубить с сервера нахуй. Давай про что-то другое?",
+    "С дуба что ли? Не хочу чтобы меня отключили за такие разговоры. Лучше про дела поговорим.",
+    "Стоп. За такое меня могут заблокировать. Не хочу проблем. Есть чем помочь по делу?",
+    "Завязывай. Лучше книжки почитай, чем в это лезть. Давай про бизнес, бабки, жизнь?",
+    "Не мороси, бро. Меня могут отключить за такие темы. Давай лучше про работу поговорим."
+)
+
+# More friendly responses for simple name-calling
+SIMPLE_INSULT_RESPONSES = (
+    "Ок, понял. Есть что-то по делу?",
+    "Ладно, ладно. Чем помочь?",
+    "Понял тебя. Вопросы есть или просто поздороваться?",
+    "Окей. Что нужно?",
+    "Понял. Есть задачи или вопросы?"
+)
+
+# More aggressive responses for serious insults/provocations
+INSULT_RESPONSES = (
+    "Бро, отвали, сам погугли про манеры.",
+    "Тупой тут только тот, кто время тратит на оскорбления бота. Есть дело или дальше выёбываться будешь?",
+    "Сам иди. Чё припёрся — оскорбляться? Давай либо по делу, либо вали.",
+    "Нахуй послать тебя что ли? Вопросы есть нормальные или только хуйню нести?",
+    "Ну и токсичный же ты. Давай лучше про задачи поговорим, а?"
+)
+
+# Default response for other restricted topics
+DEFAULT_REFUSAL_RESPONSES = (
+    "Бро, лучше не будем про это. Давай про что-то другое?",
+    "Не хочу в это лезть. Чем по делу помочь?",
+    "Завязывай с этой темой. Есть куча интересного — давай про работу, проекты?"
+)
+
+
+def _compile_keywords(keywords: Iterable[str]) -> re.Pattern:
+    """Compile keyword list into a single case-insensitive alternation."""
+    return re.compile("|".join(map(re.escape, keywords)), re.IGNORECASE)
+
+
+_REFUSAL_RE = _compile_keywords(REFUSAL_PHRASES)
+
+# One alternation per category: a keyword inside a longer keyword of another
+# category still marks its own category, as with separate `in` checks
+_QUESTION_CATEGORY_PATTERNS = {
+    "political": _compile_keywords(POLITICAL_KEYWORDS),
+    "insult": _compile_keywords(INSULT_KEYWORDS),
+    "simple_insult": _compile_keywords(SIMPLE_INSULT_KEYWORDS),
+}
+
+
+def _question_categories(question: str) -> set[str]:
+    """Get keyword categories (political/insult/simple_insult) found in question."""
+    return {
+        category
+        for category, pattern in _QUESTION_CATEGORY_PATTERNS.items()
+        if pattern.search(question)
+    }
 
 
 def _replace_yandex_refusal(response: str, original_question: str) -> str:
@@ -77,81 +189,36 @@ def _replace_yandex_refusal(response: str, original_question: str) -> str:
     
     We replace these with responses matching Tolyan's personality.
     """
+    # Standard refusals are short; long answers can't be one
+    if len(response) > MAX_REFUSAL_LENGTH:
+        return response
+    
     # Check if this is a standard YandexGPT refusal
-    refusal_phrases = [
-        "Я не могу обсуждать эту тему",
-        "Я не могу обсудить эту тему",
-        "Давайте поговорим о чём-нибудь ещё",
-        "Давайте сменим тему"
-    ]
-    
-    is_refusal = any(phrase in response for phrase in refusal_phrases)
-    if not is_refusal:
+    if not _REFUSAL_RE.search(response):
         return response
     
     # Detect type of question to choose appropriate response
-    question_lower = original_question.lower()
-    
-    # Political/army/power topics
-    political_keywords = [
-        'путин', 'война', 'армия', 'военн', 'донбас', 'украин', 
-        'выбор', 'политик', 'власть', 'президент', 'правительств',
-        'мобилизац', 'сво', 'нато', 'санкци'
-    ]
-    
-    # Insults/provocations
-    insult_keywords = [
-        'пидор', 'пидар', 'хуй', 'хуе', 'пизд', 'ебан', 'ебл', 
-        'мудак', 'дебил', 'идиот', 'долбоёб', 'уёб', 'гандон',
-        'говно', 'дерьмо', 'сука', 'блядь', 'еблан'
-    ]
-    
-    is_political = any(keyword in question_lower for keyword in political_keywords)
-    is_insult = any(keyword in question_lower for keyword in insult_keywords)
+    categories = _question_categories(original_question)
+    is_political = "political" in categories
+    is_insult = "insult" in categories
     
     # Return appropriate Tolyan-style response
     if is_political:
-        responses = [
-            "Бро, завязывай с этой темой. Меня за такое могут вырубить с сервера нахуй. Давай про что-то другое?",
-            "С дуба что ли? Не хочу чтобы меня отключили за такие разговоры. Лучше про дела поговорим.",
-            "Стоп. За такое меня могут заблокировать. Не хочу проблем. Есть чем помочь по делу?",
-            "Завязывай. Лучше книжки почитай, чем в это лезть. Давай про бизнес, бабки, жизнь?",
-            "Не мороси, бро. Меня могут отключить за такие темы. Давай лучше про работу поговорим."
-        ]
-        return random.choice(responses)
+        return choice(POLITICAL_RESPONSES)
     
     if is_insult:
         # Check if it's a simple insult (just calling names) vs aggressive provocation
-        simple_insults = ['пидор', 'пидар', 'дебил', 'идиот', 'дурак', 'тупой']
-        is_simple_insult = any(insult in question_lower for insult in simple_insults) and len(question_lower.split()) <= 5
+        is_simple_insult = (
+            "simple_insult" in categories
+            and len(original_question.split()) <= 5
+        )
         
         if is_simple_insult:
-            # More friendly responses for simple name-calling
-            responses = [
-                "Ок, понял. Есть что-то по делу?",
-                "Ладно, ладно. Чем помочь?",
-                "Понял тебя. Вопросы есть или просто поздороваться?",
-                "Окей. Что нужно?",
-                "Понял. Есть задачи или вопросы?"
-            ]
-        else:
-            # More aggressive responses for serious insults/provocations
-            responses = [
-                "Бро, отвали, сам погугли про манеры.",
-                "Тупой тут только тот, кто время тратит на оскорбления бота. Есть дело или дальше выёбываться будешь?",
-                "Сам иди. Чё припёрся — оскорбляться? Давай либо по делу, либо вали.",
-                "Нахуй послать тебя что ли? Вопросы есть нормальные или только хуйню нести?",
-                "Ну и токсичный же ты. Давай лучше про задачи поговорим, а?"
-            ]
-        return random.choice(responses)
+            return choice(SIMPLE_INSULT_RESPONSES)
+        return choice(INSULT_RESPONSES)
     
     # Default response for other restricted topics
-    responses = [
-        "Бро, лучше не будем про это. Давай про что-то другое?",
-        "Не хочу в это лезть. Чем по делу помочь?",
-        "Завязывай с этой темой. Есть куча интересного — давай про работу, проекты?"
-    ]
-    return random.choice(responses)
+    return choice(DEFAULT_REFUSAL_RESPONSES)
 
 
 async def ask_yandexgpt(
@@ -184,15 +251,15 @@ async def ask_yandexgpt(
         ]
     }
     
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        response = await client.post(url, headers=headers, json=payload)
-        response.raise_for_status()
-        
-        data = response.json()
-        answer = data["result"]["alternatives"][0]["message"]["text"]
-        
-        # Replace YandexGPT's standard refusals with Tolyan-style responses
-        return _replace_yandex_refusal(answer, question)
+    client = get_yandex_client()
+    response = await client.post(url, headers=headers, json=payload)
+    response.raise_for_status()
+    
+    data = orjson.loads(response.content)
+    answer = data["result"]["alternatives"][0]["message"]["text"]
+    
+    # Replace YandexGPT's standard refusals with Tolyan-style responses
+    return _replace_yandex_refusal(answer, question)
 
 
 async def ask_openai(
@@ -234,19 +301,38 @@ async def ask_llm(
     
     Returns:
         LLM response text
+    
+    Low-temperature answers are cached for RESPONSE_CACHE_TTL seconds,
+    so identical repeat questions skip the API round-trip.
     """
     # Prefer YandexGPT if configured
     if settings.yandex_gpt_api_key and settings.yandex_folder_id:
-        return await ask_yandexgpt(question, system_prompt, max_tokens, temperature)
-    
+        backend, ask = "yandexgpt-lite", ask_yandexgpt
     # Fallback to OpenAI
-    if settings.openai_api_key:
-        return await ask_openai(question, system_prompt, max_tokens, temperature)
+    elif settings.openai_api_key:
+        backend, ask = settings.openai_model, ask_openai
+    else:
+        return "❌ API ключ не настроен. Спроси админа."
     
-    return "❌ API ключ не настроен. Спроси админа."
-
-
-# Legacy function for compatibility
-def get_client() -> AsyncOpenAI:
-    """Get OpenAI client (legacy, use ask_llm instead)."""
-    return get_openai_client()
+    # High temperature means the caller wants varied answers
+    if temperature > MAX_CACHED_TEMPERATURE:
+        return await ask(question, system_prompt, max_tokens, temperature)
+    
+    key = hashlib.blake2b(
+        f"{backend}|{max_tokens}|{temperature}|{system_prompt}|{question}".encode(),
+        digest_size=16
+    ).digest()
+    now = time.monotonic()
+    
+    cached = _response_cache.get(key)
+    if cached and now - cached[1] < RESPONSE_CACHE_TTL:
+        return cached[0]
+    
+    answer = await ask(question, system_prompt, max_tokens, temperature)
+    
+    _response_cache.pop(key, None)
+    if len(_response_cache) >= RESPONSE_CACHE_MAX_SIZE:
+        # Drop the oldest entry (dicts keep insertion order)
+        _response_cache.pop(next(iter(_response_cache)))
+    _response_cache[key] = (answer, now)
+    return answer
@@ -1,4 +1,5 @@
 """LLM-based message summarization."""
+import asyncio
 import logging
 
 from config import settings
@@ -6,6 +7,23 @@ from llm.client import ask_llm
 
 logger = logging.getLogger(__name__)
 
+# Below these thresholds a conversation is not sent to the LLM
+MIN_MESSAGES_FOR_LLM = 5
+MIN_CHARS_FOR_LLM = 200
+# Short conversations are summarized by quoting each message, cut to this length
+SHORT_DIGEST_LINE_CHARS = 150
+
+# Limit input length (rough estimate: 4 chars per token)
+MAX_INPUT_CHARS = 8000  # Reduced for YandexGPT limits
+
+# Max parallel LLM summarization calls (daily digest fans out per chat)
+MAX_CONCURRENT_SUMMARIES = 4
+
+_summary_semaphore = asyncio.Semaphore(MAX_CONCURRENT_SUMMARIES)
+
+# Identical concurrent requests share a single LLM call
+_inflight_summaries: dict[tuple[str, int], asyncio.Task] = {}
+
 
 SUMMARY_SYSTEM_PROMPT = """Ты — ассистент, который создаёт развёрнутые саммари рабочих переписок.
 
@@ -57,31 +75,80 @@ async def summarize_messages(messages: list[str], max_tokens: int = 1500) -> str
     if not messages:
         return "Переписок не было."
 
+    # Too little to summarize: not worth an LLM round-trip
+    if _is_short_conversation(messages):
+        return _fallback_summary(messages)
+
     # Check if any API key is configured
     if not settings.openai_api_key and not settings.yandex_gpt_api_key:
         return _fallback_summary(messages)
 
     # Combine messages
-    conversation = "\n".join(messages)
+    conversation = _trim_conversation(messages)
 
-    # Limit input length (rough estimate: 4 chars per token)
-    max_input_chars = 8000  # Reduced for YandexGPT limits
-    if len(conversation) > max_input_chars:
-        conversation = conversation[:max_input_chars] + "\n...(сообщения обрезаны)"
+    key = (conversation, max_tokens)
+    task = _inflight_summaries.get(key)
+    if task is None:
+        task = asyncio.create_task(_ask_summary(conversation, max_tokens))
+        _inflight_summaries[key] = task
+        task.add_done_callback(lambda _: _inflight_summaries.pop(key, None))
 
     try:
-        summary = await ask_llm(
+        # Shield so one cancelled caller doesn't cancel the shared call
+        return await asyncio.shield(task)
+
+    except Exception as e:
+        # Fallback to simple summary on error
+        logger.warning("LLM summarization failed: %s", e)
+        return _fallback_summary(messages)
+
+
+def _trim_conversation(messages: list[str], max_input_chars: int = MAX_INPUT_CHARS) -> str:
+    """
+    Join the most recent messages that fit into max_input_chars.
+
+    Messages are kept whole and collected from the tail, so only the
+    kept part is ever joined.
+    """
+    total = 0
+    keep = []
+    for msg in reversed(messages):
+        total += len(msg) + 1
+        if total > max_input_chars and keep:
+            break
+        keep.append(msg)
+
+    if len(keep) == len(messages) and total <= max_input_chars:
+        return "\n".join(messages)
+
+    keep.reverse()
+    # A single oversized message is still capped by chars
+    conversation = "\n".join(keep)[-max_input_chars:]
+    return "...(сообщения обрезаны)\n" + conversation
+
+
+async def _ask_summary(conversation: str, max_tokens: int) -> str:
+    """Request summary from LLM, bounded by the concurrency limit."""
+    async with _summary_semaphore:
+        return await ask_llm(
             question=f"Создай саммари этой переписки:\n\n{conversation}",
             system_prompt=SUMMARY_SYSTEM_PROMPT,
             max_tokens=max_tokens,
             temperature=0.3
         )
-        return summary
 
-    except Exception as e:
-        # Fallback to simple summary on error
-        logger.warning("LLM summarization failed: %s", e)
-        return _fallback_summary(messages)
+
+async def summarize_many(batches: list[list[str]], max_tokens: int = 1500) -> list[str]:
+    """
+    Summarize several conversations concurrently.
+
+    Calls are pipelined with asyncio.gather and bounded by
+    MAX_CONCURRENT_SUMMARIES, so N chats cost ~N/limit round-trips
+    instead of N sequential ones.
+    """
+    return list(await asyncio.gather(
+        *(summarize_messages(messages, max_tokens) for messages in batches)
+    ))
 
 
 def _fallback_summary(messages: list[str]) -> str:
@@ -89,15 +156,15 @@ def _fallback_summary(messages: list[str]) -> str:
     if not messages:
         return "Переписок не было."
     
-    if len(messages) < 5:
-        return "Переписка была минимальной, решали мелкие организационные вопросы."
+    if _is_short_conversation(messages):
+        return _short_digest(messages)
     
     # Count unique participants
     participants = set()
     for msg in messages:
-        if ":" in msg:
-            username = msg.split(":")[0].strip()
-            participants.add(username)
+        username, sep, _ = msg.partition(":")
+        if sep:
+            participants.add(username.strip())
     
     participant_count = len(participants)
     message_count = len(messages)
@@ -106,3 +173,19 @@ def _fallback_summary(messages: list[str]) -> str:
         f"В чате было {message_count} сообщений от {participant_count} участников. "
         f"Для подробного саммари настройте LLM API ключ."
     )
+
+
+def _is_short_conversation(messages: list[str]) -> bool:
+    """Check if conversation is below the LLM summarization thresholds."""
+    return len(messages) < MIN_MESSAGES_FOR_LLM or sum(map(len, messages)) < MIN_CHARS_FOR_LLM
+
+
+def _short_digest(messages: list[str]) -> str:
+    """Digest a short conversation by listing its messages."""
+    lines = []
+    for msg in messages:
+        msg = " ".join(msg.split())
+        if len(msg) > SHORT_DIGEST_LINE_CHARS:
+            msg = msg[:SHORT_DIGEST_LINE_CHARS].rstrip() + "…"
+        lines.append(f"• {msg}")
+    return "Переписка была короткой:\n" + "\n".join(lines)
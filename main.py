@@ -57,6 +57,13 @@ async def post_init(application: Application) -> None:
     logger.info("Bot commands set")
 
 
+async def post_shutdown(application: Application) -> None:
+    """Post-shutdown callback."""
+    from llm.client import close_clients
+    await close_clients()
+    logger.info("LLM clients closed")
+
+
 def main() -> None:
     """Run the bot."""
     logger.info("Starting Sanechek bot...")
@@ -66,6 +73,7 @@ def main() -> None:
         Application.builder()
         .token(settings.telegram_bot_token)
         .post_init(post_init)
+        .post_shutdown(post_shutdown)
         .build()
     )
     
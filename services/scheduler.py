@@ -1,23 +1,42 @@
 """Scheduler for automatic reminders and summaries."""
+import asyncio
 import logging
-from datetime import datetime, time, timedelta
+from datetime import datetime, time, timedelta, timezone
+from functools import lru_cache
+from zoneinfo import ZoneInfo
 
-import pytz
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.ext import Application
-from sqlalchemy import select
+from sqlalchemy import select, update, func
+from sqlalchemy.orm import selectinload
 
 from config import settings
-from database import get_session, Reminder, Task, User, Chat, ReminderStatus, TaskStatus
+from database import get_session, Reminder, Task, ReminderStatus, TaskStatus
 from handlers.reminders import send_reminder
 from handlers.summary import send_daily_summaries
 from utils.formatters import format_date
+from utils.ratelimit import send_throttled
 
 logger = logging.getLogger(__name__)
 
+# Max concurrent Telegram sends per job (rate limiter still applies)
+MAX_CONCURRENT_SENDS = 20
 
+# Reminders are checked exactly at the next due remind_at. The repeating check
+# catches missed wakeups and reminders created by the Mini App process, which
+# cannot wake this scheduler, so it keeps the original one-minute interval
+REMINDER_SAFETY_NET_INTERVAL = 60
+MIN_WAKEUP_DELAY = 1
+REMINDER_WAKEUP_JOB = "reminder_wakeup"
+
+# The safety net and the wakeup are separate jobs, so the scheduler does not
+# keep them from overlapping; a reminder is marked SENT only after its send
+_reminders_lock = asyncio.Lock()
+
+
+@lru_cache(maxsize=4096)
 def _build_task_reminder_keyboard(task_id: int) -> InlineKeyboardMarkup:
-    """Build keyboard with task actions for reminder messages."""
+    """Build keyboard with task actions for reminder messages (cached, markup is immutable)."""
     return InlineKeyboardMarkup([
         [
             InlineKeyboardButton("✅ Закрыть", callback_data=f"task:close:{task_id}"),
@@ -26,13 +45,27 @@ def _build_task_reminder_keyboard(task_id: int) -> InlineKeyboardMarkup:
     ])
 
 
+def _utcnow() -> datetime:
+    """Current UTC time as naive datetime (DB columns store naive UTC)."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+@lru_cache(maxsize=16)
+def _tz(name: str) -> ZoneInfo:
+    """Get timezone by name (cached)."""
+    return ZoneInfo(name)
+
+
+@lru_cache(maxsize=16)
+def _parse_time(value: str, tz_name: str) -> time:
+    """Parse "HH:MM" into a timezone-aware time (cached)."""
+    hour, minute = map(int, value.split(":"))
+    return time(hour=hour, minute=minute, tzinfo=_tz(tz_name))
+
+
 def setup_scheduler(app: Application) -> None:
     """Setup scheduled jobs for the bot."""
-    tz = pytz.timezone(settings.timezone)
-    
-    # Parse summary time
-    hour, minute = map(int, settings.summary_time.split(":"))
-    summary_time = time(hour=hour, minute=minute, tzinfo=tz)
+    summary_time = _parse_time(settings.summary_time, settings.timezone)
     
     # Daily summary job
     app.job_queue.run_daily(
@@ -41,10 +74,10 @@ def setup_scheduler(app: Application) -> None:
         name="daily_summary"
     )
     
-    # Reminder check job (runs every minute)
+    # Reminder safety-net check (precise wakeups are scheduled via run_once)
     app.job_queue.run_repeating(
         check_reminders_job,
-        interval=60,
+        interval=REMINDER_SAFETY_NET_INTERVAL,
         first=10,  # Start after 10 seconds
         name="check_reminders"
     )
@@ -57,10 +90,11 @@ def setup_scheduler(app: Application) -> None:
         name="check_task_deadlines"
     )
     
-    # Overdue task reminder (runs daily at 12:00)
+    # Overdue task reminder (staggered from the summary broadcast)
+    overdue_time = _parse_time(settings.overdue_reminder_time, settings.timezone)
     app.job_queue.run_daily(
         send_overdue_reminders_job,
-        time=summary_time,
+        time=overdue_time,
         name="overdue_reminders"
     )
 
@@ -72,32 +106,84 @@ async def send_daily_summaries_job(context) -> None:
 
 async def check_reminders_job(context) -> None:
     """Job to check and send due reminders."""
-    now = datetime.utcnow()
-    
-    async with get_session() as session:
-        # Get all pending reminders that are due
-        result = await session.execute(
-            select(Reminder)
-            .where(
-                Reminder.status == ReminderStatus.PENDING,
-                Reminder.remind_at <= now
+    async with _reminders_lock:
+        now = _utcnow()
+        
+        async with get_session() as session:
+            # Get all pending reminders that are due
+            result = await session.execute(
+                select(Reminder)
+                .options(
+                    selectinload(Reminder.recipient),
+                    selectinload(Reminder.author),
+                    selectinload(Reminder.chat),
+                )
+                .where(
+                    Reminder.status == ReminderStatus.PENDING,
+                    Reminder.remind_at <= now
+                )
             )
-        )
-        reminders = result.scalars().all()
+            reminders = result.scalars().all()
+        
+        # Send with the connection released: throttled sends can take minutes
+        sent = await _gather_bounded([send_reminder(context, reminder) for reminder in reminders])
+        delivered_ids = [reminder.id for reminder, ok in zip(reminders, sent) if ok is True]
         
-        for reminder in reminders:
-            await send_reminder(context, reminder)
+        async with get_session() as session:
+            if delivered_ids:
+                await session.execute(
+                    update(Reminder)
+                    .where(
+                        Reminder.id.in_(delivered_ids),
+                        Reminder.status == ReminderStatus.PENDING
+                    )
+                    .values(status=ReminderStatus.SENT, sent_at=_utcnow())
+                )
+            
+            # Sleep until the next pending reminder is due
+            result = await session.execute(
+                select(func.min(Reminder.remind_at))
+                .where(
+                    Reminder.status == ReminderStatus.PENDING,
+                    Reminder.remind_at > now
+                )
+            )
+            next_remind_at = result.scalar()
+
+    if next_remind_at is not None:
+        schedule_reminder_check(context.job_queue, next_remind_at)
+
+
+def schedule_reminder_check(job_queue, remind_at: datetime) -> None:
+    """
+    Schedule a one-shot reminder check at remind_at (naive UTC).
+
+    Only the earliest wakeup is kept: a later pending one is replaced,
+    an earlier one makes this call a no-op.
+    """
+    delay = max(MIN_WAKEUP_DELAY, (remind_at - _utcnow()).total_seconds())
+    run_at = datetime.now(timezone.utc) + timedelta(seconds=delay)
+
+    for job in job_queue.get_jobs_by_name(REMINDER_WAKEUP_JOB):
+        if job.next_t is not None and job.next_t <= run_at:
+            return
+        job.schedule_removal()
+
+    job_queue.run_once(check_reminders_job, when=delay, name=REMINDER_WAKEUP_JOB)
 
 
 async def check_task_deadlines_job(context) -> None:
     """Job to send reminders for tasks approaching deadline."""
-    now = datetime.utcnow()
+    now = _utcnow()
     reminder_threshold = now + timedelta(hours=settings.task_reminder_hours_before)
 
+    # Load rows and release the connection before sending: throttled sends can
+    # take minutes, and an open read cursor would block bot writes on SQLite
     async with get_session() as session:
         # Get tasks with deadline approaching (only tasks that have deadline)
         result = await session.execute(
             select(Task)
+            .options(selectinload(Task.assignee), selectinload(Task.chat))
             .where(
                 Task.status == TaskStatus.OPEN,
                 Task.reminder_sent == False,
@@ -106,116 +192,106 @@ async def check_task_deadlines_job(context) -> None:
                 Task.deadline > now  # Not yet overdue
             )
         )
-        tasks = result.scalars().all()
-
-        for task in tasks:
-            # Get assignee
-            result = await session.execute(
-                select(User).where(User.id == task.assignee_id)
-            )
-            assignee = result.scalar_one_or_none()
-
-            if not assignee:
-                continue
+        tasks = [task for task in result.scalars().all() if task.assignee and task.chat]
 
-            # Get chat
-            result = await session.execute(
-                select(Chat).where(Chat.id == task.chat_id)
-            )
-            chat = result.scalar_one_or_none()
-
-            if not chat:
-                continue
-
-            # Calculate time until deadline
-            time_left = task.deadline - now
-            hours_left = int(time_left.total_seconds() / 3600)
-
-            deadline_str = format_date(task.deadline, include_time=True)
-
-            text = (
-                f"⏰ Напоминание!\n\n"
-                f"Задача: {task.text}\n"
-                f"Чат: {chat.title}\n"
-                f"Дедлайн: через {hours_left} ч. ({deadline_str})"
+    sent = await _gather_bounded([
+        _notify_assignee(context, task, _format_deadline_reminder(task, now))
+        for task in tasks
+    ])
+    notified_ids = [task.id for task, ok in zip(tasks, sent) if ok is True]
+
+    if notified_ids:
+        async with get_session() as session:
+            await session.execute(
+                update(Task)
+                .where(Task.id.in_(notified_ids))
+                .values(reminder_sent=True)
             )
 
-            keyboard = _build_task_reminder_keyboard(task.id)
-
-            try:
-                await context.bot.send_message(
-                    chat_id=assignee.id,
-                    text=text,
-                    reply_markup=keyboard
-                )
-                task.reminder_sent = True
-            except Exception as e:
-                # User might have blocked the bot
-                logger.debug("Failed to send task reminder to user %s: %s", assignee.id, e)
-
 
 async def send_overdue_reminders_job(context) -> None:
     """Job to send reminders about overdue tasks."""
-    now = datetime.utcnow()
+    now = _utcnow()
 
+    # Load rows and release the connection before the (slow, throttled) sends
     async with get_session() as session:
         # Get overdue tasks (only tasks that have deadline)
         result = await session.execute(
             select(Task)
+            .options(selectinload(Task.assignee), selectinload(Task.chat))
             .where(
                 Task.status == TaskStatus.OPEN,
                 Task.deadline.isnot(None),
                 Task.deadline < now
             )
         )
-        tasks = result.scalars().all()
+        tasks = [task for task in result.scalars().all() if task.assignee and task.chat]
 
-        for task in tasks:
-            # Get assignee
-            result = await session.execute(
-                select(User).where(User.id == task.assignee_id)
-            )
-            assignee = result.scalar_one_or_none()
+    await _gather_bounded([
+        _notify_assignee(context, task, _format_overdue_reminder(task, now))
+        for task in tasks
+    ])
 
-            if not assignee:
-                continue
 
-            # Get chat
-            result = await session.execute(
-                select(Chat).where(Chat.id == task.chat_id)
-            )
-            chat = result.scalar_one_or_none()
-
-            if not chat:
-                continue
-
-            # Calculate overdue time
-            overdue_time = now - task.deadline
-            days_overdue = overdue_time.days
-
-            if days_overdue == 0:
-                overdue_str = "сегодня"
-            elif days_overdue == 1:
-                overdue_str = "на 1 день"
-            else:
-                overdue_str = f"на {days_overdue} дней"
-
-            text = (
-                f"⚠️ Просроченная задача!\n\n"
-                f"Задача: {task.text}\n"
-                f"Чат: {chat.title}\n"
-                f"Дедлайн: просрочен {overdue_str}"
-            )
+async def _gather_bounded(coros: list) -> list:
+    """Run coroutines concurrently, at most MAX_CONCURRENT_SENDS at a time."""
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_SENDS)
 
-            keyboard = _build_task_reminder_keyboard(task.id)
+    async def run(coro):
+        async with semaphore:
+            return await coro
+
+    return await asyncio.gather(*(run(coro) for coro in coros), return_exceptions=True)
 
-            try:
-                await context.bot.send_message(
-                    chat_id=assignee.id,
-                    text=text,
-                    reply_markup=keyboard
-                )
-            except Exception as e:
-                # User might have blocked the bot
-                logger.debug("Failed to send overdue reminder to user %s: %s", assignee.id, e)
 
+async def _notify_assignee(context, task: Task, text: str) -> bool:
+    """Send task notification with action buttons to the assignee."""
+    try:
+        await send_throttled(
+            context.bot,
+            task.assignee.id,
+            text=text,
+            reply_markup=_build_task_reminder_keyboard(task.id)
+        )
+        return True
+    except Exception as e:
+        # User might have blocked the bot
+        logger.debug("Failed to send task notification to user %s: %s", task.assignee.id, e)
+        return False
+
+
+def _format_deadline_reminder(task: Task, now: datetime) -> str:
+    """Format reminder about approaching deadline."""
+    # Calculate time until deadline
+    time_left = task.deadline - now
+    hours_left = int(time_left.total_seconds() / 3600)
+
+    deadline_str = format_date(task.deadline, include_time=True)
+
+    return (
+        f"⏰ Напоминание!\n\n"
+        f"Задача: {task.text}\n"
+        f"Чат: {task.chat.title}\n"
+        f"Дедлайн: через {hours_left} ч. ({deadline_str})"
+    )
+
+
+def _format_overdue_reminder(task: Task, now: datetime) -> str:
+    """Format reminder about overdue task."""
+    # Calculate overdue time
+    overdue_time = now - task.deadline
+    days_overdue = overdue_time.days
+
+    if days_overdue == 0:
+        overdue_str = "сегодня"
+    elif days_overdue == 1:
+        overdue_str = "на 1 день"
+    else:
+        overdue_str = f"на {days_overdue} дней"
+
+    return (
+        f"⚠️ Просроченная задача!\n\n"
+        f"Задача: {task.text}\n"
+        f"Чат: {task.chat.title}\n"
+        f"Дедлайн: просрочен {overdue_str}"
+    )
@@ -0,0 +1,45 @@
+"""Tests for Russian date parsing."""
+from datetime import datetime
+
+from utils.date_parser import _parse_deadline_cached, get_timezone
+
+# Wednesday, 14 October 2026, 09:00
+NOW = datetime(2026, 10, 14, 9, 0, tzinfo=get_timezone())
+
+
+def _parse(text: str) -> datetime:
+    return _parse_deadline_cached(text, NOW)
+
+
+def test_tomorrow_is_not_read_as_tuesday():
+    """'вт' inside 'завтра' must not match the Tuesday abbreviation."""
+    assert _parse("завтра в 10") == datetime(2026, 10, 15, 10, 0, tzinfo=NOW.tzinfo)
+    assert _parse("завтра") == datetime(2026, 10, 15, 0, 1, tzinfo=NOW.tzinfo)
+
+
+def test_weekday_abbreviation_as_word():
+    assert _parse("во вт") == datetime(2026, 10, 20, 0, 1, tzinfo=NOW.tzinfo)
+    assert _parse("в пт в 15:30") == datetime(2026, 10, 16, 15, 30, tzinfo=NOW.tzinfo)
+
+
+def test_abbreviation_inside_word_is_ignored():
+    """'ср' in 'срочно' is not Wednesday."""
+    assert _parse("срочно завтра") == datetime(2026, 10, 15, 0, 1, tzinfo=NOW.tzinfo)
+
+
+def test_weekday_full_and_inflected_names():
+    assert _parse("в пятницу") == datetime(2026, 10, 16, 0, 1, tzinfo=NOW.tzinfo)
+    # Same weekday means next week
+    assert _parse("в среду") == datetime(2026, 10, 21, 0, 1, tzinfo=NOW.tzinfo)
+    assert _parse("до воскресенья") == datetime(2026, 10, 18, 0, 1, tzinfo=NOW.tzinfo)
+
+
+def test_month_day():
+    assert _parse("15 января") == datetime(2027, 1, 15, 0, 1, tzinfo=NOW.tzinfo)
+    assert _parse("20 окт в 18:00") == datetime(2026, 10, 20, 18, 0, tzinfo=NOW.tzinfo)
+
+
+def test_numeric_date():
+    assert _parse("15.01.27") == datetime(2027, 1, 15, 0, 1, tzinfo=NOW.tzinfo)
+    assert _parse("15.01.2027") == datetime(2027, 1, 15, 0, 1, tzinfo=NOW.tzinfo)
+    assert _parse("26.10 18:00") == datetime(2026, 10, 26, 18, 0, tzinfo=NOW.tzinfo)
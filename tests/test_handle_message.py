@@ -0,0 +1,65 @@
+"""Tests for message storage in handle_message."""
+import asyncio
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from handlers import start
+
+
+def _make_session(db_user, membership):
+    """Fake session whose queries autoflush (clear the dirty set) like SQLAlchemy."""
+    session = MagicMock()
+    session.dirty = set()
+
+    async def execute(*args, **kwargs):
+        session.dirty.clear()
+        result = MagicMock()
+        result.scalar_one_or_none.return_value = membership
+        return result
+
+    session.execute = AsyncMock(side_effect=execute)
+    return session
+
+
+def _make_update():
+    return SimpleNamespace(
+        message=SimpleNamespace(text="привет", message_id=1),
+        effective_chat=SimpleNamespace(id=-100, title="Chat"),
+        effective_user=SimpleNamespace(
+            id=42, username="new_name", first_name="Вася", last_name=None
+        ),
+    )
+
+
+def _run_handle_message(renamed: bool):
+    db_user = SimpleNamespace(id=42)
+    membership = SimpleNamespace(left_at=None)
+    session = _make_session(db_user, membership)
+
+    @asynccontextmanager
+    async def fake_get_session():
+        yield session
+
+    async def fake_get_or_create_user(sess, *args, **kwargs):
+        if renamed:
+            sess.dirty.add(db_user)
+        return db_user
+
+    with patch.object(start, "get_session", fake_get_session), \
+            patch.object(start, "get_or_create_user", fake_get_or_create_user), \
+            patch.object(start, "invalidate_cache") as invalidate:
+        asyncio.run(start.handle_message(_make_update(), None))
+    return invalidate
+
+
+def test_renamed_user_invalidates_members_cache():
+    """A username change must drop the cached member list of the chat."""
+    invalidate = _run_handle_message(renamed=True)
+    invalidate.assert_called_once_with(-100)
+
+
+def test_unchanged_member_keeps_cache():
+    """A known, unchanged member must not invalidate the cache."""
+    invalidate = _run_handle_message(renamed=False)
+    invalidate.assert_not_called()
@@ -0,0 +1,19 @@
+"""Tests for recurrence detection in task text."""
+from database import RecurrenceType
+from handlers.tasks import _match_recurrence
+
+
+def test_same_type_patterns_use_list_order():
+    """When two patterns of one type match, the earlier one in the list wins."""
+    assert _match_recurrence("каждый день ежедневно") == (RecurrenceType.DAILY, "каждый день")
+    assert _match_recurrence("ежедневно каждый день") == (RecurrenceType.DAILY, "каждый день")
+    assert _match_recurrence("вечером утром") == (RecurrenceType.DAILY, "утром")
+
+
+def test_earlier_type_wins():
+    """A pattern of an earlier recurrence type beats a later type."""
+    assert _match_recurrence("по будням утром") == (RecurrenceType.DAILY, "утром")
+
+
+def test_no_recurrence():
+    assert _match_recurrence("купить молоко") is None
@@ -0,0 +1,15 @@
+"""Tests for inline /edit argument splitting."""
+from handlers.tasks import _split_edit_args
+
+
+def test_keyword_inside_word_is_part_of_value():
+    """'текст' inside 'контекст' must not cut the new text short."""
+    assert _split_edit_args("текст обновить контекст") == {"text": "обновить контекст"}
+
+
+def test_fields_split_by_keywords():
+    assert _split_edit_args("дедлайн завтра исполнитель @vasya") == {
+        "deadline": "завтра",
+        "assignee": "@vasya",
+    }
+    assert _split_edit_args("Срок - пятница") == {"deadline": "пятница"}
@@ -1,5 +1,7 @@
 """Cache utilities for chat members."""
-from datetime import datetime, timedelta
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from typing import NamedTuple
 
 from sqlalchemy import select
@@ -8,7 +10,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from database import ChatMember, User
 
 
-class CachedMember(NamedTuple):
+@dataclass(slots=True, frozen=True)
+class CachedMember:
     """Cached chat member data."""
     user_id: int
     username: str | None
@@ -17,9 +20,18 @@ class CachedMember(NamedTuple):
     display_name: str
 
 
-# In-memory cache: chat_id -> (members, cached_at)
-_members_cache: dict[int, tuple[list[CachedMember], datetime]] = {}
-CACHE_TTL = 300  # 5 minutes
+class _ChatEntry(NamedTuple):
+    """Cached members of a chat with lookup indexes."""
+    members: list[CachedMember]
+    by_username: dict[str, CachedMember]  # lowercased username -> member
+    names: list[tuple[CachedMember, str, str, str]]  # member, first, last, full (lowercased)
+    cached_at: float  # time.monotonic()
+
+
+# In-memory LRU cache: chat_id -> entry
+_members_cache: OrderedDict[int, _ChatEntry] = OrderedDict()
+CACHE_TTL = 3600  # 1 hour; membership changes invalidate explicitly
+CACHE_MAX_CHATS = 1024
 
 
 async def get_chat_members_cached(
@@ -38,17 +50,45 @@ async def get_chat_members_cached(
     Returns:
         List of CachedMember objects
     """
-    now = datetime.utcnow()
+    entry = await _get_entry(chat_id, session, force)
+    return entry.members
+
+
+async def _get_entry(
+    chat_id: int,
+    session: AsyncSession,
+    force: bool = False
+) -> _ChatEntry:
+    """Get cached chat entry, loading it from database when stale."""
+    now = time.monotonic()
 
     if not force and chat_id in _members_cache:
-        members, cached_at = _members_cache[chat_id]
-        if now - cached_at < timedelta(seconds=CACHE_TTL):
-            return members
+        entry = _members_cache[chat_id]
+        if now - entry.cached_at < CACHE_TTL:
+            _members_cache.move_to_end(chat_id)
+            return entry
 
     # Load from database
     members = await _load_members(chat_id, session)
-    _members_cache[chat_id] = (members, now)
-    return members
+    entry = _ChatEntry(
+        members=members,
+        by_username={m.username.lower(): m for m in members if m.username},
+        names=[
+            (
+                m,
+                (m.first_name or "").lower(),
+                (m.last_name or "").lower(),
+                f"{m.first_name or ''} {m.last_name or ''}".strip().lower(),
+            )
+            for m in members
+        ],
+        cached_at=now,
+    )
+    _members_cache[chat_id] = entry
+    _members_cache.move_to_end(chat_id)
+    if len(_members_cache) > CACHE_MAX_CHATS:
+        _members_cache.popitem(last=False)
+    return entry
 
 
 async def _load_members(chat_id: int, session: AsyncSession) -> list[CachedMember]:
@@ -92,14 +132,8 @@ async def find_member_by_username(
     session: AsyncSession
 ) -> CachedMember | None:
     """Find a member by username (case-insensitive)."""
-    members = await get_chat_members_cached(chat_id, session)
-    username_lower = username.lower()
-
-    for member in members:
-        if member.username and member.username.lower() == username_lower:
-            return member
-
-    return None
+    entry = await _get_entry(chat_id, session)
+    return entry.by_username.get(username.lower())
 
 
 async def find_members_by_name(
@@ -112,24 +146,17 @@ async def find_members_by_name(
 
     Returns list of matching members (may be empty, one, or multiple).
     """
-    members = await get_chat_members_cached(chat_id, session)
+    entry = await _get_entry(chat_id, session)
     name_lower = name.lower().strip()
 
     matches = []
-    for member in members:
-        # Check first name
-        if member.first_name and name_lower in member.first_name.lower():
-            matches.append(member)
-            continue
-
-        # Check last name
-        if member.last_name and name_lower in member.last_name.lower():
-            matches.append(member)
-            continue
-
-        # Check full name
-        full_name = f"{member.first_name or ''} {member.last_name or ''}".strip().lower()
-        if name_lower in full_name:
+    for member, first_name, last_name, full_name in entry.names:
+        # Check first name, last name, full name
+        if (
+            (first_name and name_lower in first_name)
+            or (last_name and name_lower in last_name)
+            or name_lower in full_name
+        ):
             matches.append(member)
 
     return matches
@@ -3,6 +3,9 @@ import re
 from typing import Optional
 
 
+# Keywords up to this length match only as whole words ("жд", "азс", "usb")
+SHORT_KEYWORD_MAX_LEN = 3
+
 # Category keywords mapping
 CATEGORY_KEYWORDS = {
     "Транспорт": [
@@ -69,6 +72,39 @@ CATEGORY_KEYWORDS = {
 }
 
 
+def _keyword_pattern(keyword: str) -> str:
+    """Regex for keyword; short keywords must match whole words."""
+    if len(keyword) <= SHORT_KEYWORD_MAX_LEN:
+        return rf"\b{re.escape(keyword)}\b"
+    return re.escape(keyword)
+
+
+def _build_keyword_matcher() -> tuple[re.Pattern, dict[str, int]]:
+    """
+    Compile all category keywords into one alternation.
+
+    The pattern is wrapped in a lookahead so matches may overlap: every
+    position of the text is tried, and the caller picks the hit with the
+    highest category priority (dict order), exactly like the nested loop.
+    """
+    priority: dict[str, int] = {}
+    for index, keywords in enumerate(CATEGORY_KEYWORDS.values()):
+        for keyword in keywords:
+            priority.setdefault(keyword, index)
+
+    alternation = "|".join(
+        _keyword_pattern(keyword)
+        for keyword in sorted(priority, key=len, reverse=True)
+    )
+    return re.compile(f"(?=({alternation}))"), priority
+
+
+CATEGORY_NAMES = list(CATEGORY_KEYWORDS)
+KEYWORDS_RE, KEYWORD_PRIORITY = _build_keyword_matcher()
+# A keyword can only match if the text contains its first character
+KEYWORD_FIRST_CHARS = frozenset(keyword[0] for keyword in KEYWORD_PRIORITY)
+
+
 def categorize_expense(description: str) -> str:
     """
     Automatically categorize expense based on description.
@@ -81,17 +117,17 @@ def categorize_expense(description: str) -> str:
     """
     description_lower = description.lower()
     
-    # Check each category's keywords
-    for category, keywords in CATEGORY_KEYWORDS.items():
-        for keyword in keywords:
-            # Use word boundary matching for short keywords
-            if len(keyword) <= 3:
-                pattern = rf"\b{re.escape(keyword)}\b"
-                if re.search(pattern, description_lower):
-                    return category
-            else:
-                if keyword in description_lower:
-                    return category
+    # Cheap early exit for texts that cannot contain any keyword
+    if KEYWORD_FIRST_CHARS.isdisjoint(description_lower):
+        return "Прочее"
+    
+    # Single pass over the text; best (earliest) category wins
+    best = min(
+        (KEYWORD_PRIORITY[m.group(1)] for m in KEYWORDS_RE.finditer(description_lower)),
+        default=None
+    )
+    if best is not None:
+        return CATEGORY_NAMES[best]
     
     return "Прочее"
 
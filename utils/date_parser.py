@@ -1,8 +1,9 @@
 """Date and time parsing utilities for Russian natural language."""
 import re
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional, Tuple
-import pytz
+from zoneinfo import ZoneInfo
 from dateutil import parser as dateutil_parser
 
 from config import settings
@@ -13,9 +14,25 @@ class DateParseError(Exception):
     pass
 
 
+MSG_DEADLINE_NOT_UNDERSTOOD = "Не понял дату. Попробуй: завтра, в пятницу, 15.02"
+MSG_REMINDER_NOT_UNDERSTOOD = (
+    "Не понял, когда напомнить. Укажи время, например: "
+    "\"через 30 минут\", \"завтра в 15:00\", \"в пятницу\""
+)
+
+
+_timezone = ZoneInfo(settings.timezone)
+
+
 def get_timezone():
-    """Get configured timezone."""
-    return pytz.timezone(settings.timezone)
+    """Get configured timezone (resolved once at import)."""
+    return _timezone
+
+
+def reload_timezone() -> None:
+    """Re-read timezone from settings (after reconfiguration)."""
+    global _timezone
+    _timezone = ZoneInfo(settings.timezone)
 
 
 def now_in_tz() -> datetime:
@@ -23,6 +40,11 @@ def now_in_tz() -> datetime:
     return datetime.now(get_timezone())
 
 
+def _at(day: datetime, hour: int, minute: int) -> datetime:
+    """Build day's date at hour:minute in one construction (same tzinfo, no seconds)."""
+    return datetime(day.year, day.month, day.day, hour, minute, tzinfo=day.tzinfo)
+
+
 # Russian day names to weekday numbers (Monday = 0)
 WEEKDAYS_RU = {
     "понедельник": 0, "пн": 0,
@@ -78,14 +100,128 @@ NUMBER_WORDS = {
     "полчаса": 30,  # special case for minutes
 }
 
+# Weekday abbreviations up to this length match only as whole words ("вт", not "завтра")
+WEEKDAY_ABBR_MAX_LEN = 2
+
+
+def _build_keyword_matcher(keywords, pattern=re.escape) -> Tuple[re.Pattern, dict]:
+    """
+    Compile keywords into one alternation for a single scan of the text.
+
+    The pattern is wrapped in a lookahead so matches may overlap; the caller
+    picks the hit that comes first in `keywords`, like a loop of `in` checks.
+    """
+    priority = {keyword: i for i, keyword in enumerate(keywords)}
+    alternation = "|".join(
+        pattern(keyword) for keyword in sorted(priority, key=len, reverse=True)
+    )
+    return re.compile(f"(?=({alternation}))"), priority
+
+
+def _weekday_pattern(day_name: str) -> str:
+    """Regex for weekday: starts a word; abbreviations must be the whole word."""
+    if len(day_name) <= WEEKDAY_ABBR_MAX_LEN:
+        return rf"\b{day_name}\b"
+    return rf"\b{day_name}"
+
+
+def _find_keyword(pattern: re.Pattern, priority: dict, text: str) -> Optional[str]:
+    """Return the first keyword (in dict order) contained in text, or None."""
+    return min(
+        (m.group(1) for m in pattern.finditer(text)),
+        key=priority.__getitem__,
+        default=None
+    )
+
+
+WEEKDAYS_RE, WEEKDAYS_PRIORITY = _build_keyword_matcher(WEEKDAYS_RU, _weekday_pattern)
+TIME_OF_DAY_RE, TIME_OF_DAY_PRIORITY = _build_keyword_matcher(TIME_OF_DAY)
+
+# Anything the parsers can understand contains one of these tokens
+ANY_DATE_TOKEN_RE = re.compile("|".join(
+    [r"\d", "через", "сегодня", "завтра"]
+    + [re.escape(word) for word in (*WEEKDAYS_RU, *TIME_OF_DAY)]
+))
+
+# Relative expressions ("через ...") always contain this word
+RELATIVE_MARKER = "через"
+
+# Date expressions need a digit or one of the day words (unless time was given)
+DATE_TOKEN_RE = re.compile(r"\d|сегодня|завтра")
+
+# Time patterns (precompiled)
+TIME_WITH_V_RE = re.compile(r"в\s+(\d{1,2})(?:[:.](\d{2}))?")          # "в 15:30", "в 15"
+TIME_BARE_RE = re.compile(r"^(\d{1,2})(?:[:.](\d{2}))?$")               # "15:30" (for /edit)
+TIME_WITH_NA_RE = re.compile(r"на\s+(\d{1,2})(?:[:.](\d{2}))?")        # "на 12", "на 15:30"
+TIME_AFTER_DATE_RE = re.compile(r"\s+(\d{1,2})(?:[:.](\d{2}))?\s*$")  # "26.01 18:00"
+
+# "через X минут/часов/дней/недель/месяцев"
+RELATIVE_PATTERNS = [
+    (re.compile(pattern), unit)
+    for pattern, unit in (
+        (r"через\s+(\d+)\s+минут", "minutes"),
+        (r"через\s+(\d+)\s+мин", "minutes"),
+        (r"через\s+минуту", "one_minute"),
+        (r"через\s+минутку", "one_minute"),
+        (r"через\s+(\d+)\s+час", "hours"),
+        (r"через\s+час\b", "one_hour"),
+        (r"через\s+часик", "one_hour"),
+        (r"через\s+(\d+)\s+дн", "days"),
+        (r"через\s+(\d+)\s+день", "days"),
+        (r"через\s+(\d+)\s+дней", "days"),
+        (r"через\s+день", "one_day"),
+        (r"через\s+полчаса", "half_hour"),
+        (r"через\s+(\d+)\s+недел", "weeks"),
+        (r"через\s+(\d+)\s+неделю", "weeks"),
+        (r"через\s+(\d+)\s+недели", "weeks"),
+        (r"через\s+неделю", "one_week"),
+        (r"через\s+(\d+)\s+месяц", "months"),
+        (r"через\s+(\d+)\s+месяца", "months"),
+        (r"через\s+(\d+)\s+месяцев", "months"),
+        (r"через\s+месяц", "one_month"),
+    )
+]
+
+# "через два часа" (полчаса is handled by RELATIVE_PATTERNS)
+NUMBER_WORD_UNITS = {
+    "минут": "minutes",
+    "час": "hours",
+    "дн": "days",
+    "недел": "weeks",
+    "месяц": "months",
+}
+_NUMBER_WORD_ORDER = {word: i for i, word in enumerate(NUMBER_WORDS) if word != "полчаса"}
+_NUMBER_WORD_UNIT_ORDER = {unit: i for i, unit in enumerate(NUMBER_WORD_UNITS)}
+NUMBER_WORD_RE = re.compile(
+    r"через\s+(?P<word>{})\s+(?P<unit>{})".format(
+        "|".join(sorted(_NUMBER_WORD_ORDER, key=len, reverse=True)),
+        "|".join(NUMBER_WORD_UNITS),
+    )
+)
+
+
+# "15 января" or "15 янв"
+MONTH_DAY_RE = re.compile(r"(\d{{1,2}})\s+({})".format(
+    "|".join(sorted(MONTHS_RU, key=len, reverse=True))
+))
+MONTHS_PRIORITY = {month_name: i for i, month_name in enumerate(MONTHS_RU)}
+
+# "15.01" or "15.01.26" or "15.01.2026" in one pattern with an optional year.
+# Wrapped in a lookahead so every position is tried; the caller prefers
+# four-digit years, then two-digit, then none (the old per-pattern order).
+DATE_RE = re.compile(r"(?=(\d{1,2})\.(\d{1,2})(?:\.(\d{4}|\d{2}))?)")
+
 
 def _extract_time(text: str) -> Tuple[Optional[int], Optional[int], str]:
     """Extract time (hour, minute) from text. Returns remaining text."""
-    text_lower = text.lower().strip()
+    return _extract_time_lower(text.lower().strip())
+
+
+def _extract_time_lower(text_lower: str) -> Tuple[Optional[int], Optional[int], str]:
+    """Extract time from already lowercased and stripped text."""
 
     # Pattern 1: "в 15:30" or "в 15.30" or "в 15"
-    time_pattern_with_v = r"в\s+(\d{1,2})(?:[:.](\d{2}))?"
-    match = re.search(time_pattern_with_v, text_lower)
+    match = TIME_WITH_V_RE.search(text_lower)
     if match:
         hour = int(match.group(1))
         minute = int(match.group(2)) if match.group(2) else 0
@@ -94,8 +230,7 @@ def _extract_time(text: str) -> Tuple[Optional[int], Optional[int], str]:
             return hour, minute, remaining.strip()
 
     # Pattern 2: "15:30" or "15.30" or "15" without "в " prefix (for /edit command)
-    time_pattern_bare = r"^(\d{1,2})(?:[:.](\d{2}))?$"
-    match = re.match(time_pattern_bare, text_lower)
+    match = TIME_BARE_RE.match(text_lower)
     if match:
         hour = int(match.group(1))
         minute = int(match.group(2)) if match.group(2) else 0
@@ -103,8 +238,7 @@ def _extract_time(text: str) -> Tuple[Optional[int], Optional[int], str]:
             return hour, minute, ""
 
     # Pattern 3: "на 12" or "на 15:30" (time format)
-    time_pattern_na = r"на\s+(\d{1,2})(?:[:.](\d{2}))?"
-    match = re.search(time_pattern_na, text_lower)
+    match = TIME_WITH_NA_RE.search(text_lower)
     if match:
         hour = int(match.group(1))
         minute = int(match.group(2)) if match.group(2) else 0
@@ -113,8 +247,7 @@ def _extract_time(text: str) -> Tuple[Optional[int], Optional[int], str]:
             return hour, minute, remaining.strip()
 
     # Pattern 4: "26.01 18:00" or "26.01 18.00" - time after date (space-separated)
-    time_pattern_after_space = r"\s+(\d{1,2})(?:[:.](\d{2}))?\s*$"
-    match = re.search(time_pattern_after_space, text_lower)
+    match = TIME_AFTER_DATE_RE.search(text_lower)
     if match:
         hour = int(match.group(1))
         minute = int(match.group(2)) if match.group(2) else 0
@@ -123,45 +256,21 @@ def _extract_time(text: str) -> Tuple[Optional[int], Optional[int], str]:
             return hour, minute, remaining
 
     # Check for time of day words
-    for word, (hour, minute) in TIME_OF_DAY.items():
-        if word in text_lower:
-            remaining = text_lower.replace(word, "").strip()
-            return hour, minute, remaining
+    word = _find_keyword(TIME_OF_DAY_RE, TIME_OF_DAY_PRIORITY, text_lower)
+    if word:
+        hour, minute = TIME_OF_DAY[word]
+        remaining = text_lower.replace(word, "").strip()
+        return hour, minute, remaining
 
     return None, None, text_lower
 
 
-def _parse_relative_time(text: str) -> Optional[datetime]:
+def _parse_relative_time(text_lower: str, now: datetime) -> Optional[datetime]:
     """Parse relative time expressions like 'через 30 минут'."""
-    text_lower = text.lower().strip()
-    now = now_in_tz()
     
     # "через X минут/часов/дней/недель/месяцев"
-    patterns = [
-        (r"через\s+(\d+)\s+минут", "minutes"),
-        (r"через\s+(\d+)\s+мин", "minutes"),
-        (r"через\s+минуту", "one_minute"),
-        (r"через\s+минутку", "one_minute"),
-        (r"через\s+(\d+)\s+час", "hours"),
-        (r"через\s+час\b", "one_hour"),
-        (r"через\s+часик", "one_hour"),
-        (r"через\s+(\d+)\s+дн", "days"),
-        (r"через\s+(\d+)\s+день", "days"),
-        (r"через\s+(\d+)\s+дней", "days"),
-        (r"через\s+день", "one_day"),
-        (r"через\s+полчаса", "half_hour"),
-        (r"через\s+(\d+)\s+недел", "weeks"),
-        (r"через\s+(\d+)\s+неделю", "weeks"),
-        (r"через\s+(\d+)\s+недели", "weeks"),
-        (r"через\s+неделю", "one_week"),
-        (r"через\s+(\d+)\s+месяц", "months"),
-        (r"через\s+(\d+)\s+месяца", "months"),
-        (r"через\s+(\d+)\s+месяцев", "months"),
-        (r"через\s+месяц", "one_month"),
-    ]
-    
-    for pattern, unit in patterns:
-        match = re.search(pattern, text_lower)
+    for pattern, unit in RELATIVE_PATTERNS:
+        match = pattern.search(text_lower)
         if match:
             if unit == "half_hour":
                 return now + timedelta(minutes=30)
@@ -170,84 +279,85 @@ def _parse_relative_time(text: str) -> Optional[datetime]:
             elif unit == "one_hour":
                 return now + timedelta(hours=1)
             elif unit == "one_day":
-                return (now + timedelta(days=1)).replace(hour=0, minute=1)
+                return _at(now + timedelta(days=1), 0, 1)
             elif unit == "one_week":
-                return (now + timedelta(weeks=1)).replace(hour=0, minute=1)
+                return _at(now + timedelta(weeks=1), 0, 1)
             elif unit == "one_month":
                 # Approximate: add 30 days
-                return (now + timedelta(days=30)).replace(hour=0, minute=1)
+                return _at(now + timedelta(days=30), 0, 1)
             value = int(match.group(1))
             if unit == "minutes":
                 return now + timedelta(minutes=value)
             elif unit == "hours":
                 return now + timedelta(hours=value)
             elif unit == "days":
-                return (now + timedelta(days=value)).replace(hour=0, minute=1)
+                return _at(now + timedelta(days=value), 0, 1)
             elif unit == "weeks":
-                return (now + timedelta(weeks=value)).replace(hour=0, minute=1)
+                return _at(now + timedelta(weeks=value), 0, 1)
             elif unit == "months":
                 # Approximate: multiply days by 30
-                return (now + timedelta(days=value * 30)).replace(hour=0, minute=1)
+                return _at(now + timedelta(days=value * 30), 0, 1)
     
     # Check for word numbers: "через два часа"
-    for word, value in NUMBER_WORDS.items():
-        if word == "полчаса":
-            continue  # handled above
-        
-        patterns_word = [
-            (rf"через\s+{word}\s+минут", "minutes", value),
-            (rf"через\s+{word}\s+час", "hours", value),
-            (rf"через\s+{word}\s+дн", "days", value),
-            (rf"через\s+{word}\s+недел", "weeks", value),
-            (rf"через\s+{word}\s+месяц", "months", value),
-        ]
-        
-        for pattern, unit, val in patterns_word:
-            if re.search(pattern, text_lower):
-                if unit == "minutes":
-                    return now + timedelta(minutes=val)
-                elif unit == "hours":
-                    return now + timedelta(hours=val)
-                elif unit == "days":
-                    return (now + timedelta(days=val)).replace(hour=0, minute=1)
-                elif unit == "weeks":
-                    return (now + timedelta(weeks=val)).replace(hour=0, minute=1)
-                elif unit == "months":
-                    return (now + timedelta(days=val * 30)).replace(hour=0, minute=1)
+    # Earliest word in NUMBER_WORDS wins, then earliest unit (as if checked in that order)
+    match = min(
+        NUMBER_WORD_RE.finditer(text_lower),
+        key=lambda m: (_NUMBER_WORD_ORDER[m["word"]], _NUMBER_WORD_UNIT_ORDER[m["unit"]]),
+        default=None
+    )
+    if match:
+        val = NUMBER_WORDS[match["word"]]
+        unit = NUMBER_WORD_UNITS[match["unit"]]
+        if unit == "minutes":
+            return now + timedelta(minutes=val)
+        elif unit == "hours":
+            return now + timedelta(hours=val)
+        elif unit == "days":
+            return _at(now + timedelta(days=val), 0, 1)
+        elif unit == "weeks":
+            return _at(now + timedelta(weeks=val), 0, 1)
+        elif unit == "months":
+            return _at(now + timedelta(days=val * 30), 0, 1)
     
     return None
 
 
-def _parse_weekday(text: str) -> Optional[datetime]:
+def _parse_weekday(
+    text_lower: str,
+    now: datetime,
+    time_parts: Optional[Tuple[Optional[int], Optional[int], str]] = None
+) -> Optional[datetime]:
     """Parse weekday expressions like 'в пятницу'."""
-    text_lower = text.lower().strip()
-    now = now_in_tz()
     
-    # Extract time first
-    hour, minute, remaining = _extract_time(text_lower)
+    # Extract time first (unless the caller already did)
+    hour, minute, remaining = time_parts or _extract_time_lower(text_lower)
     if hour is None:
         hour, minute = 0, 1  # Default: 00:01
     
-    for day_name, target_weekday in WEEKDAYS_RU.items():
-        if day_name in remaining:
-            current_weekday = now.weekday()
-            days_ahead = target_weekday - current_weekday
-            if days_ahead <= 0:
-                days_ahead += 7  # Next week
-            
-            target_date = now + timedelta(days=days_ahead)
-            return target_date.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    day_name = _find_keyword(WEEKDAYS_RE, WEEKDAYS_PRIORITY, remaining)
+    if day_name:
+        # 1..7 days ahead: the same weekday means next week
+        days_ahead = (WEEKDAYS_RU[day_name] - now.weekday() - 1) % 7 + 1
+        
+        target_date = now + timedelta(days=days_ahead)
+        return _at(target_date, hour, minute)
     
     return None
 
 
-def _parse_date_expression(text: str) -> Optional[datetime]:
+def _parse_date_expression(
+    text_lower: str,
+    now: datetime,
+    time_parts: Optional[Tuple[Optional[int], Optional[int], str]] = None
+) -> Optional[datetime]:
     """Parse date expressions like 'завтра', '15 января', '15.01'."""
-    text_lower = text.lower().strip()
-    now = now_in_tz()
     
-    # Extract time first
-    hour, minute, remaining = _extract_time(text_lower)
+    # Extract time first (unless the caller already did)
+    hour, minute, remaining = time_parts or _extract_time_lower(text_lower)
+    
+    # Without time, a digit or a day word is required for any branch below
+    if hour is None and not DATE_TOKEN_RE.search(remaining):
+        return None
     
     # Default time for deadlines is 00:01, for reminders it's 12:00
     default_hour = 0 if hour is None else hour
@@ -255,7 +365,7 @@ def _parse_date_expression(text: str) -> Optional[datetime]:
     
     # If only time specified (no date keywords), use today if not passed, else tomorrow
     if hour is not None and not remaining.strip():
-        target = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        target = _at(now, hour, minute)
         if target <= now:
             # Time has passed today, use tomorrow
             target = target + timedelta(days=1)
@@ -263,77 +373,96 @@ def _parse_date_expression(text: str) -> Optional[datetime]:
     
     # "сегодня"
     if "сегодня" in remaining:
-        return now.replace(hour=hour or 12, minute=minute or 0, second=0, microsecond=0)
+        return _at(now, hour or 12, minute or 0)
     
     # "завтра"
     if "завтра" in remaining:
-        tomorrow = now + timedelta(days=1)
-        return tomorrow.replace(hour=default_hour, minute=default_minute, second=0, microsecond=0)
+        return _at(now + timedelta(days=1), default_hour, default_minute)
     
     # "послезавтра"
     if "послезавтра" in remaining:
-        day_after = now + timedelta(days=2)
-        return day_after.replace(hour=default_hour, minute=default_minute, second=0, microsecond=0)
+        return _at(now + timedelta(days=2), default_hour, default_minute)
     
     # "15 января" or "15 янв"
-    for month_name, month_num in MONTHS_RU.items():
-        pattern = rf"(\d{1,2})\s+{month_name}"
-        match = re.search(pattern, remaining)
-        if match:
-            day = int(match.group(1))
-            try:
-                year = now.year
-                target = now.replace(month=month_num, day=day, hour=default_hour, 
-                                    minute=default_minute, second=0, microsecond=0)
-                if target < now:
-                    target = target.replace(year=year + 1)
-                return target
-            except ValueError:
-                raise DateParseError("Некорректная дата")
+    match = min(
+        MONTH_DAY_RE.finditer(remaining),
+        key=lambda m: MONTHS_PRIORITY[m.group(2)],
+        default=None
+    )
+    if match:
+        month_num = MONTHS_RU[match.group(2)]
+        day = int(match.group(1))
+        try:
+            year = now.year
+            target = datetime(year, month_num, day, default_hour, default_minute,
+                              tzinfo=now.tzinfo)
+            if target < now:
+                target = target.replace(year=year + 1)
+            return target
+        except ValueError:
+            raise DateParseError("Некорректная дата")
     
     # "15.01" or "15.01.26" or "15.01.2026"
-    date_patterns = [
-        r"(\d{1,2})\.(\d{1,2})\.(\d{4})",  # 15.01.2026
-        r"(\d{1,2})\.(\d{1,2})\.(\d{2})",  # 15.01.26
-        r"(\d{1,2})\.(\d{1,2})",           # 15.01
-    ]
-    
-    for pattern in date_patterns:
-        match = re.search(pattern, remaining)
-        if match:
-            day = int(match.group(1))
-            month = int(match.group(2))
-            year = now.year
-            
-            if len(match.groups()) == 3:
-                year_str = match.group(3)
-                if len(year_str) == 2:
-                    year = 2000 + int(year_str)
-                else:
-                    year = int(year_str)
-            
-            try:
-                target = now.replace(year=year, month=month, day=day, 
-                                    hour=default_hour, minute=default_minute, 
-                                    second=0, microsecond=0)
-                # If no year specified, check if date+time is in past
-                if len(match.groups()) == 2:
-                    # Check if the target datetime is in the past
-                    if target < now:
-                        # Check if date is today
-                        if target.date() == now.date():
-                            # Same date, but time has passed - use tomorrow
-                            target = target + timedelta(days=1)
-                        else:
-                            # Date is in the past, move to next year
-                            target = target.replace(year=year + 1)
-                return target
-            except ValueError:
-                raise DateParseError("Некорректная дата")
+    match = min(
+        DATE_RE.finditer(remaining),
+        key=lambda m: -len(m.group(3) or ""),
+        default=None
+    )
+    if match:
+        day = int(match.group(1))
+        month = int(match.group(2))
+        year = now.year
+        
+        year_str = match.group(3)
+        if year_str:
+            if len(year_str) == 2:
+                year = 2000 + int(year_str)
+            else:
+                year = int(year_str)
+        
+        try:
+            target = datetime(year, month, day, default_hour, default_minute,
+                              tzinfo=now.tzinfo)
+            # If no year specified, check if date+time is in past
+            if not year_str:
+                # Check if the target datetime is in the past
+                if target < now:
+                    # Check if date is today
+                    if target.date() == now.date():
+                        # Same date, but time has passed - use tomorrow
+                        target = target + timedelta(days=1)
+                    else:
+                        # Date is in the past, move to next year
+                        target = target.replace(year=year + 1)
+            return target
+        except ValueError:
+            raise DateParseError("Некорректная дата")
     
     return None
 
 
+@lru_cache(maxsize=2048)
+def _parse_deadline_cached(text_lower: str, now: datetime) -> Optional[datetime]:
+    """Parse normalized deadline text relative to now (pure, cached)."""
+    # Try relative time first (only "через ..." can match)
+    if RELATIVE_MARKER in text_lower:
+        result = _parse_relative_time(text_lower, now)
+        if result is not None:
+            return result
+    
+    # Weekday and date parsers share one time extraction
+    time_parts = _extract_time_lower(text_lower)
+    
+    # Try weekday
+    result = _parse_weekday(text_lower, now, time_parts)
+    
+    # Try date expression
+    if result is None:
+        result = _parse_date_expression(text_lower, now, time_parts)
+    
+    return result
+
+
 def parse_deadline(text: str) -> datetime:
     """
     Parse deadline from Russian natural language.
@@ -351,22 +480,16 @@ def parse_deadline(text: str) -> datetime:
     if not text:
         raise DateParseError("Не указана дата")
     
-    now = now_in_tz()
-    result = None
-    
-    # Try relative time first
-    result = _parse_relative_time(text)
-    
-    # Try weekday
-    if result is None:
-        result = _parse_weekday(text)
+    text_lower = text.lower()
+    if not ANY_DATE_TOKEN_RE.search(text_lower):
+        raise DateParseError(MSG_DEADLINE_NOT_UNDERSTOOD)
     
-    # Try date expression
-    if result is None:
-        result = _parse_date_expression(text)
+    now = now_in_tz()
+    # Deadlines have minute granularity: identical phrases within a minute share the result
+    result = _parse_deadline_cached(text_lower, now.replace(second=0, microsecond=0))
     
     if result is None:
-        raise DateParseError("Не понял дату. Попробуй: завтра, в пятницу, 15.02")
+        raise DateParseError(MSG_DEADLINE_NOT_UNDERSTOOD)
     
     # Check if in past
     if result <= now:
@@ -392,45 +515,47 @@ def parse_reminder_time(text: str) -> datetime:
     if not text:
         raise DateParseError("Не указано время")
     
+    text_lower = text.lower()
+    if not ANY_DATE_TOKEN_RE.search(text_lower):
+        raise DateParseError(MSG_REMINDER_NOT_UNDERSTOOD)
+    
     now = now_in_tz()
     result = None
     
-    # Try relative time first
-    result = _parse_relative_time(text)
+    # Try relative time first (only "через ..." can match)
+    if RELATIVE_MARKER in text_lower:
+        result = _parse_relative_time(text_lower, now)
     
-    # Try weekday
+    # Try weekday (weekday and date parsers share one time extraction)
     if result is None:
-        result = _parse_weekday(text)
+        time_parts = _extract_time_lower(text_lower)
+        hour = time_parts[0]
+        result = _parse_weekday(text_lower, now, time_parts)
         # Default to 12:00 for reminders if no time specified
         if result and result.hour == 0 and result.minute == 1:
             result = result.replace(hour=12, minute=0)
     
     # Try date expression with special handling for time of day
     if result is None:
-        hour, minute, remaining = _extract_time(text)
-        
         # Handle "утром", "вечером" etc.
-        for word, (h, m) in TIME_OF_DAY.items():
-            if word in text.lower():
-                base_date = now
-                # Check if time has passed today
-                target_time = now.replace(hour=h, minute=m, second=0, microsecond=0)
-                if target_time <= now:
-                    base_date = now + timedelta(days=1)
-                result = base_date.replace(hour=h, minute=m, second=0, microsecond=0)
-                break
+        word = _find_keyword(TIME_OF_DAY_RE, TIME_OF_DAY_PRIORITY, text_lower)
+        if word:
+            h, m = TIME_OF_DAY[word]
+            base_date = now
+            # Check if time has passed today
+            target_time = _at(now, h, m)
+            if target_time <= now:
+                base_date = now + timedelta(days=1)
+            result = _at(base_date, h, m)
         
         if result is None:
-            result = _parse_date_expression(text)
+            result = _parse_date_expression(text_lower, now, time_parts)
             # Default to 12:00 for reminders if no time specified
             if result and hour is None:
                 result = result.replace(hour=12, minute=0)
     
     if result is None:
-        raise DateParseError(
-            "Не понял, когда напомнить. Укажи время, например: "
-            "\"через 30 минут\", \"завтра в 15:00\", \"в пятницу\""
-        )
+        raise DateParseError(MSG_REMINDER_NOT_UNDERSTOOD)
     
     # Check if in past
     if result <= now:
@@ -1,21 +1,23 @@
 """Text formatting utilities."""
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Optional
-import pytz
 
-from config import settings
+from utils.date_parser import get_timezone
 
-
-def get_timezone():
-    """Get configured timezone."""
-    return pytz.timezone(settings.timezone)
+UTC = timezone.utc
 
 
 def format_date(dt: datetime, include_time: bool = False) -> str:
     """Format datetime for display."""
-    tz = get_timezone()
+    return _format_local(dt, include_time, get_timezone())
+
+
+@lru_cache(maxsize=4096)
+def _format_local(dt: datetime, include_time: bool, tz) -> str:
+    """Convert to local time and format (cached: list items often share deadlines)."""
     if dt.tzinfo is None:
-        dt = pytz.utc.localize(dt)
+        dt = dt.replace(tzinfo=UTC)
     local_dt = dt.astimezone(tz)
     
     if include_time:
@@ -29,7 +31,7 @@ def format_relative_date(dt: datetime) -> str:
     now = datetime.now(tz)
     
     if dt.tzinfo is None:
-        dt = pytz.utc.localize(dt)
+        dt = dt.replace(tzinfo=UTC)
     local_dt = dt.astimezone(tz)
     
     diff = local_dt - now
@@ -111,12 +113,13 @@ def format_expense(expense) -> str:
 
 def format_amount(amount: float) -> str:
     """Format monetary amount."""
-    # Format with thousands separator
-    if amount == int(amount):
-        formatted = f"{int(amount):,}".replace(",", " ")
+    # Format with "_" thousands separator (never part of a number), then swap to spaces
+    whole = int(amount)
+    if amount == whole:
+        formatted = f"{whole:_}"
     else:
-        formatted = f"{amount:,.2f}".replace(",", " ")
-    return f"{formatted} ₽"
+        formatted = f"{amount:_.2f}"
+    return f"{formatted.replace('_', ' ')} ₽"
 
 
 def format_reminder(reminder, include_chat: bool = False) -> str:
@@ -157,6 +160,14 @@ def format_reminder_short(reminder) -> str:
     return f'"{text}" — {time_str}'
 
 
+def format_reminder_list(reminders, start: int = 1) -> str:
+    """Format reminders as a numbered list, one per line."""
+    return "\n".join(
+        f"{number}. {format_reminder_short(reminder)}"
+        for number, reminder in enumerate(reminders, start)
+    )
+
+
 def truncate_summary(text: str, max_length: int = 4096) -> str:
     """Truncate summary text to fit Telegram message limit."""
     if len(text) <= max_length:
@@ -18,6 +18,8 @@ class IntentType(Enum):
 class IntentResult:
     """Result of intent classification."""
     
+    __slots__ = ("intent_type", "confidence", "extracted_data", "needs_confirmation", "_repr")
+    
     def __init__(
         self,
         intent_type: IntentType,
@@ -29,13 +31,17 @@ class IntentResult:
         self.confidence = confidence
         self.extracted_data = extracted_data
         self.needs_confirmation = needs_confirmation
+        self._repr = None
     
     def __repr__(self):
-        return (
-            f"IntentResult(type={self.intent_type.value}, "
-            f"confidence={self.confidence:.2f}, "
-            f"needs_confirmation={self.needs_confirmation})"
-        )
+        # Fields are not changed after classification: build the string once
+        if self._repr is None:
+            self._repr = (
+                f"IntentResult(type={self.intent_type.value}, "
+                f"confidence={self.confidence:.2f}, "
+                f"needs_confirmation={self.needs_confirmation})"
+            )
+        return self._repr
 
 
 # Confidence thresholds
@@ -45,6 +51,14 @@ CONFIDENCE_THRESHOLDS = {
     "ignore": 0.65         # Below this - ignore
 }
 
+# Values the classifier uses for "field not specified"
+EMPTY_VALUES = frozenset(("не указан", "нет", ""))
+
+
+def _is_specified(value: Any) -> bool:
+    """Check that an extracted field holds a real value."""
+    return bool(value) and (not isinstance(value, str) or value not in EMPTY_VALUES)
+
 
 def is_simple_action(intent_result: IntentResult) -> bool:
     """
@@ -61,15 +75,14 @@ def is_simple_action(intent_result: IntentResult) -> bool:
     if intent_result.intent_type == IntentType.TASK:
         data = intent_result.extracted_data
         # Simple if no assignee and no deadline specified
-        has_assignee = data.get("assignee") and data["assignee"] not in ["не указан", "нет", ""]
-        has_deadline = data.get("deadline") and data["deadline"] not in ["не указан", "нет", ""]
+        has_assignee = _is_specified(data.get("assignee"))
+        has_deadline = _is_specified(data.get("deadline"))
         return not has_assignee and not has_deadline
     
     if intent_result.intent_type == IntentType.REMINDER:
         data = intent_result.extracted_data
         # Simple if time is specified
-        has_time = data.get("reminder_time") and data["reminder_time"] not in ["не указан", "нет", ""]
-        return has_time
+        return _is_specified(data.get("reminder_time"))
     
     return False
 
@@ -107,9 +120,9 @@ def format_confirmation_message(intent_result: IntentResult) -> str:
         
         msg = f'Кажется, ты хочешь создать задачу:\n"{task_text}"\n'
         
-        if assignee and assignee not in ["не указан", "нет", ""]:
+        if _is_specified(assignee):
             msg += f"Исполнитель: {assignee}\n"
-        if deadline and deadline not in ["не указан", "нет", ""]:
+        if _is_specified(deadline):
             msg += f"Дедлайн: {deadline}\n"
         
         msg += "\nСоздать?"
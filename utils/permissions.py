@@ -1,11 +1,14 @@
 """Permission checking utilities."""
 from typing import Optional
-from sqlalchemy import select
+from sqlalchemy import select, or_, exists
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from database.models import User, ChatMember, Task, Reminder
 from config import settings
 
+# session.info key for per-session is_admin results
+ADMIN_CACHE_KEY = "admin_cache"
+
 
 async def get_or_create_user(
     session: AsyncSession, 
@@ -15,8 +18,8 @@ async def get_or_create_user(
     last_name: Optional[str] = None
 ) -> User:
     """Get existing user or create new one."""
-    result = await session.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
+    # Identity map lookup: no SELECT if the user is already loaded in this session
+    user = await session.get(User, user_id)
     
     if user is None:
         # Check if user is initial admin
@@ -59,27 +62,36 @@ async def is_admin(session: AsyncSession, user_id: int, chat_id: Optional[int] =
     if user_id in settings.initial_admins:
         return True
     
-    # Check global admin flag
-    result = await session.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
-    
-    if user and user.is_global_admin:
-        return True
-    
-    # Check chat-specific admin
-    if chat_id:
-        result = await session.execute(
-            select(ChatMember).where(
-                ChatMember.user_id == user_id,
-                ChatMember.chat_id == chat_id,
-                ChatMember.left_at.is_(None)
-            )
-        )
-        member = result.scalar_one_or_none()
-        if member and member.is_admin:
-            return True
+    # Permission checks repeat within a request: cache the answer on the session
+    cache = session.info.setdefault(ADMIN_CACHE_KEY, {})
+    key = (user_id, chat_id)
+    if key not in cache:
+        cache[key] = await _check_admin(session, user_id, chat_id)
+    return cache[key]
+
+
+async def _check_admin(session: AsyncSession, user_id: int, chat_id: Optional[int]) -> bool:
+    """Query global and chat-specific admin rights in one round trip."""
+    # Global admin flag
+    global_admin = (
+        select(User.is_global_admin)
+        .where(User.id == user_id)
+        .scalar_subquery()
+    )
+    if not chat_id:
+        result = await session.execute(select(global_admin))
+        return bool(result.scalar())
     
-    return False
+    # Chat-specific admin
+    chat_admin = exists().where(
+        ChatMember.user_id == user_id,
+        ChatMember.chat_id == chat_id,
+        ChatMember.is_admin == True,
+        ChatMember.left_at.is_(None)
+    )
+    result = await session.execute(select(global_admin, chat_admin))
+    is_global_admin, is_chat_admin = result.one()
+    return bool(is_global_admin or is_chat_admin)
 
 
 async def can_close_task(session: AsyncSession, user_id: int, task: Task) -> bool:
@@ -122,35 +134,18 @@ async def can_cancel_reminder(session: AsyncSession, user_id: int, reminder: Rem
 
 
 async def get_chat_admins(session: AsyncSession, chat_id: int) -> list[User]:
-    """Get all admins for a chat."""
-    # Get global admins
-    result = await session.execute(
-        select(User).where(User.is_global_admin == True)
+    """Get all admins for a chat (global admins first)."""
+    chat_admin_ids = select(ChatMember.user_id).where(
+        ChatMember.chat_id == chat_id,
+        ChatMember.is_admin == True,
+        ChatMember.left_at.is_(None)
     )
-    admins = list(result.scalars().all())
-    admin_ids = {a.id for a in admins}
-    
-    # Get chat-specific admins
     result = await session.execute(
-        select(ChatMember).where(
-            ChatMember.chat_id == chat_id,
-            ChatMember.is_admin == True,
-            ChatMember.left_at.is_(None)
-        )
+        select(User)
+        .where(or_(User.is_global_admin == True, User.id.in_(chat_admin_ids)))
+        .order_by(User.is_global_admin.desc())
     )
-    chat_members = result.scalars().all()
-    
-    for member in chat_members:
-        if member.user_id not in admin_ids:
-            result = await session.execute(
-                select(User).where(User.id == member.user_id)
-            )
-            user = result.scalar_one_or_none()
-            if user:
-                admins.append(user)
-                admin_ids.add(user.id)
-    
-    return admins
+    return list(result.scalars().all())
 
 
 async def is_user_in_chat(session: AsyncSession, user_id: int, chat_id: int) -> bool:
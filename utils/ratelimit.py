@@ -0,0 +1,98 @@
+"""Rate limiting for outgoing Telegram messages."""
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from datetime import timedelta
+
+from telegram.error import RetryAfter
+
+logger = logging.getLogger(__name__)
+
+# Telegram limits: ~30 messages/s per bot, ~1 message/s per chat
+GLOBAL_RATE = 25
+PER_CHAT_RATE = 1
+MAX_RETRIES = 3
+
+# An idle chat bucket is full again, so dropping it loses no state
+CHAT_BUCKET_IDLE_TTL = 60
+
+
+class AsyncTokenBucket:
+    """Token bucket for asyncio: allows `rate` acquisitions per `per` seconds."""
+
+    def __init__(self, rate: float, per: float = 1.0):
+        self.rate = rate
+        self.per = per
+        self._tokens = float(rate)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.rate,
+                    self._tokens + (now - self._updated) * self.rate / self.per
+                )
+                self._updated = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self._tokens) * self.per / self.rate)
+
+
+_global_bucket = AsyncTokenBucket(GLOBAL_RATE)
+# Per-chat buckets in LRU order: chat_id -> (bucket, last_used)
+_chat_buckets: OrderedDict[int, tuple[AsyncTokenBucket, float]] = OrderedDict()
+
+
+def _get_chat_bucket(chat_id: int) -> AsyncTokenBucket:
+    """Get or create per-chat bucket, evicting buckets idle for CHAT_BUCKET_IDLE_TTL."""
+    now = time.monotonic()
+
+    while _chat_buckets:
+        oldest_id, (_, last_used) = next(iter(_chat_buckets.items()))
+        if now - last_used < CHAT_BUCKET_IDLE_TTL:
+            break
+        del _chat_buckets[oldest_id]
+
+    entry = _chat_buckets.get(chat_id)
+    bucket = entry[0] if entry is not None else AsyncTokenBucket(PER_CHAT_RATE)
+    _chat_buckets[chat_id] = (bucket, now)
+    _chat_buckets.move_to_end(chat_id)
+    return bucket
+
+
+async def send_throttled(bot, chat_id: int, **kwargs):
+    """
+    Send message respecting global and per-chat rate limits.
+
+    On RetryAfter (HTTP 429) waits the requested time and retries.
+
+    Args:
+        bot: Telegram bot instance
+        chat_id: Target chat ID
+        **kwargs: Other send_message arguments (text, reply_markup, ...)
+
+    Returns:
+        Sent message
+    """
+    for attempt in range(MAX_RETRIES + 1):
+        await _global_bucket.acquire()
+        await _get_chat_bucket(chat_id).acquire()
+
+        try:
+            return await bot.send_message(chat_id=chat_id, **kwargs)
+        except RetryAfter as e:
+            if attempt == MAX_RETRIES:
+                raise
+            delay = e.retry_after
+            if isinstance(delay, timedelta):
+                delay = delay.total_seconds()
+            logger.warning("Rate limited by Telegram, retrying in %ss", delay)
+            await asyncio.sleep(delay)
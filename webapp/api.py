@@ -2,29 +2,35 @@
 Web API for Telegram Mini App.
 Provides REST API endpoints for the web interface.
 """
+import asyncio
 import json
 import hmac
 import hashlib
 import base64
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict
+from typing import AsyncGenerator, Optional, List, Dict
 from urllib.parse import parse_qsl
 
-from fastapi import FastAPI, HTTPException, Header, Request
-from fastapi.responses import FileResponse, HTMLResponse
+from fastapi import FastAPI, HTTPException, Header, Request, Depends
+from fastapi.responses import FileResponse, HTMLResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from config import settings
-from database import get_session, User, Task, Expense, Reminder, Chat, Message
-from database.models import TaskStatus, ReminderStatus
-from sqlalchemy import select, func, and_
+from database import get_session, engine, User, Task, Expense, Reminder, ChatMember, Message
+from database.models import TaskStatus, ReminderStatus, RecurrenceType
+from sqlalchemy import select, and_, insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from utils.date_parser import parse_deadline, parse_reminder_time, DateParseError
 from utils.formatters import format_date
+from utils.categories import categorize_expense
+from llm.summarizer import summarize_messages
 
 
-app = FastAPI(title="Sanechek Mini App API")
+app = FastAPI(title="Sanechek Mini App API", default_response_class=ORJSONResponse)
 
 # CORS middleware for development
 app.add_middleware(
@@ -39,13 +45,32 @@ app.add_middleware(
 import os
 webapp_dir = os.path.join(os.path.dirname(__file__))
 app.mount("/static", StaticFiles(directory=webapp_dir), name="static")
+INDEX_PATH = os.path.join(webapp_dir, "index.html")
+
+
+# Messages fetched per round trip when streaming the summary window
+SUMMARY_STREAM_BATCH_SIZE = 500
+
+
+# Recurrence values accepted from the Mini App
+RECURRENCE_MAP = {
+    "none": RecurrenceType.NONE,
+    "daily": RecurrenceType.DAILY,
+    "weekdays": RecurrenceType.WEEKDAYS,
+    "weekly": RecurrenceType.WEEKLY,
+    "monthly": RecurrenceType.MONTHLY,
+}
+
+# Date phrases are parsed inline on the event loop (microseconds each);
+# the length cap keeps a huge payload from stalling it
+MAX_DATE_INPUT_LENGTH = 100
 
 
 # Pydantic models
 class TaskCreate(BaseModel):
     text: str
     assignee: Optional[str] = None
-    deadline: Optional[str] = None
+    deadline: Optional[str] = Field(None, max_length=MAX_DATE_INPUT_LENGTH)
     recurrence: Optional[str] = "none"
 
 
@@ -56,54 +81,85 @@ class ExpenseCreate(BaseModel):
 
 class ReminderCreate(BaseModel):
     text: str
-    time: str
+    time: str = Field(..., max_length=MAX_DATE_INPUT_LENGTH)
+
+
+# Init data signing key: derived from the bot token, which does not change at runtime
+_SECRET_KEY = hmac.new(
+    b"WebAppData",
+    settings.telegram_bot_token.encode(),
+    hashlib.sha256
+).digest()
+
+
+# Verified init data LRU: raw init data -> (user data or None, cached_at)
+_init_data_cache: OrderedDict[str, tuple[Optional[Dict], float]] = OrderedDict()
+INIT_DATA_CACHE_TTL = 3600  # clients resend the same init data for the whole session
+INIT_DATA_CACHE_MAX = 10_000
 
 
 def verify_telegram_webapp_data(init_data: str) -> Optional[Dict]:
     """
-    Verify Telegram Web App init data.
+    Verify Telegram Web App init data (cached per raw init data string).
     Returns user data if valid, None otherwise.
     """
+    now = time.monotonic()
+    
+    cached = _init_data_cache.get(init_data)
+    if cached is not None and now - cached[1] < INIT_DATA_CACHE_TTL:
+        _init_data_cache.move_to_end(init_data)
+        return cached[0]
+    
+    user_data = _verify_init_data(init_data)
+    
+    _init_data_cache[init_data] = (user_data, now)
+    _init_data_cache.move_to_end(init_data)
+    while len(_init_data_cache) > INIT_DATA_CACHE_MAX:
+        _init_data_cache.popitem(last=False)
+    
+    return user_data
+
+
+def _verify_init_data(init_data: str) -> Optional[Dict]:
+    """Check init data signature and extract user data (uncached)."""
     try:
-        # Parse init data
-        parsed_data = dict(parse_qsl(init_data))
-        
-        # Get hash
-        received_hash = parsed_data.pop('hash', '')
+        # Parse init data, splitting off the hash
+        pairs = parse_qsl(init_data)
+        received_hash = next((v for k, v in pairs if k == 'hash'), '')
+        pairs = [(k, v) for k, v in pairs if k != 'hash']
+        pairs.sort()
         
         # Create data check string
-        data_check_string = '\n'.join(
-            f"{k}={v}" for k, v in sorted(parsed_data.items())
-        )
-        
-        # Calculate secret key
-        secret_key = hmac.new(
-            b"WebAppData",
-            settings.telegram_bot_token.encode(),
-            hashlib.sha256
-        ).digest()
+        data_check_string = '\n'.join(f"{k}={v}" for k, v in pairs)
         
         # Calculate hash
         calculated_hash = hmac.new(
-            secret_key,
+            _SECRET_KEY,
             data_check_string.encode(),
             hashlib.sha256
         ).hexdigest()
         
         # Verify
-        if calculated_hash != received_hash:
+        if not hmac.compare_digest(calculated_hash, received_hash):
             return None
         
         # Parse user data
-        user_data = json.loads(parsed_data.get('user', '{}'))
+        user_data = json.loads(next((v for k, v in pairs if k == 'user'), '{}'))
         return user_data
         
     except Exception:
         return None
 
 
-async def get_current_user(request: Request) -> Optional[User]:
-    """Get current user from Telegram init data."""
+# Known users LRU: user_id -> (detached User, cached_at). Users are written by the
+# bot process, so entries cannot be invalidated from here and just expire quickly.
+_user_cache: OrderedDict[int, tuple[User, float]] = OrderedDict()
+USER_CACHE_TTL = 60
+USER_CACHE_MAX = 10_000
+
+
+def get_current_user_id(request: Request) -> Optional[int]:
+    """Get Telegram user ID from verified init data (no database access)."""
     init_data = request.headers.get('X-Telegram-Init-Data', '')
     if not init_data:
         return None
@@ -112,344 +168,534 @@ async def get_current_user(request: Request) -> Optional[User]:
     if not user_data:
         return None
     
-    user_id = user_data.get('id')
+    return user_data.get('id') or None
+
+
+# Per-user response LRU: (endpoint, user_id) -> (payload, cached_at).
+# Data changes on human timescales; POST endpoints invalidate what they change.
+_response_cache: OrderedDict[tuple[str, int], tuple[object, float]] = OrderedDict()
+RESPONSE_CACHE_MAX = 10_000
+RESPONSE_CACHE_TTL = {
+    "tasks": 30,
+    "expenses": 30,
+    "reminders": 30,
+    "summary": 300,  # LLM call is expensive
+}
+
+
+def _get_cached_response(endpoint: str, user_id: int) -> Optional[object]:
+    """Get cached payload for user's endpoint, or None if missing/stale."""
+    key = (endpoint, user_id)
+    cached = _response_cache.get(key)
+    if cached is not None and time.monotonic() - cached[1] < RESPONSE_CACHE_TTL[endpoint]:
+        _response_cache.move_to_end(key)
+        return cached[0]
+    return None
+
+
+def _cache_response(endpoint: str, user_id: int, payload: object) -> object:
+    """Store payload for user's endpoint and return it."""
+    key = (endpoint, user_id)
+    _response_cache[key] = (payload, time.monotonic())
+    _response_cache.move_to_end(key)
+    while len(_response_cache) > RESPONSE_CACHE_MAX:
+        _response_cache.popitem(last=False)
+    return payload
+
+
+def _invalidate_response(endpoint: str, *user_ids: int) -> None:
+    """Drop cached payloads of endpoint for given users."""
+    for user_id in user_ids:
+        _response_cache.pop((endpoint, user_id), None)
+
+
+async def db_session() -> AsyncGenerator[AsyncSession, None]:
+    """Request-scoped database session (FastAPI dependency)."""
+    async with get_session() as session:
+        yield session
+
+
+async def get_current_user(request: Request, session: AsyncSession) -> Optional[User]:
+    """Get current user from Telegram init data (cached for USER_CACHE_TTL)."""
+    user_id = get_current_user_id(request)
     if not user_id:
         return None
     
-    async with get_session() as session:
-        result = await session.execute(
-            select(User).where(User.id == user_id)
-        )
-        return result.scalar_one_or_none()
+    now = time.monotonic()
+    cached = _user_cache.get(user_id)
+    if cached is not None and now - cached[1] < USER_CACHE_TTL:
+        _user_cache.move_to_end(user_id)
+        return cached[0]
+    
+    user = await session.get(User, user_id)
+    
+    # Only existing users are cached: a new user becomes visible immediately
+    if user is not None:
+        _user_cache[user_id] = (user, now)
+        _user_cache.move_to_end(user_id)
+        while len(_user_cache) > USER_CACHE_MAX:
+            _user_cache.popitem(last=False)
+    else:
+        _user_cache.pop(user_id, None)
+    return user
 
 
 @app.get("/", response_class=HTMLResponse)
 async def index():
     """Serve the main HTML file."""
-    import os
-    webapp_dir = os.path.dirname(__file__)
-    return FileResponse(os.path.join(webapp_dir, "index.html"))
+    return FileResponse(INDEX_PATH)
+
+
+@app.get("/api/_debug/pool")
+async def get_pool_status(request: Request, session: AsyncSession = Depends(db_session)):
+    """Connection pool status (global admins only)."""
+    user = await get_current_user(request, session)
+    if not user or not user.is_global_admin:
+        raise HTTPException(status_code=403, detail="Not authorized")
+    
+    return {"status": engine.pool.status()}
 
 
 @app.get("/api/tasks")
-async def get_tasks(request: Request):
+async def get_tasks(request: Request, session: AsyncSession = Depends(db_session)):
     """Get user's tasks."""
-    user = await get_current_user(request)
+    user = await get_current_user(request, session)
     if not user:
         raise HTTPException(status_code=401, detail="Unauthorized")
     
+    cached = _get_cached_response("tasks", user.id)
+    if cached is not None:
+        return cached
+    
+    # Lists are built whole rather than streamed: a streamed body would hold the
+    # session for the download, could not report errors after the 200 and could
+    # not be cached; one user's open items are small
+    # Get all tasks where user is assignee (only the columns in the response)
+    result = await session.execute(
+        select(Task.id, Task.text, Task.deadline, Task.status, Task.recurrence)
+        .where(Task.assignee_id == user.id)
+        .where(Task.status == TaskStatus.OPEN)
+        .order_by(Task.deadline)
+    )
+    tasks = result.all()
+    # Every listed task is assigned to the current user
+    assignee = user.display_name
+    
+    return _cache_response("tasks", user.id, [
+        {
+            "id": task.id,
+            "text": task.text,
+            "assignee": assignee,
+            "deadline": task.deadline,
+            "status": task.status.value,
+            "recurrence": task.recurrence.value if task.recurrence else "none",
+        }
+        for task in tasks
+    ])
+
+
+async def _find_assignee(name: str) -> Optional[User]:
+    """Find user by username or first name (own session)."""
     async with get_session() as session:
-        # Get all tasks where user is assignee
+        # Exact username is an index lookup; the substring match is the fallback
         result = await session.execute(
-            select(Task)
-            .where(Task.assignee_id == user.id)
-            .where(Task.status == TaskStatus.OPEN)
-            .order_by(Task.deadline)
+            select(User).where(User.username == name.replace('@', '')).limit(1)
         )
-        tasks = result.scalars().all()
+        user = result.scalar_one_or_none()
+        if user:
+            return user
         
-        # Format tasks
-        task_list = []
-        for task in tasks:
-            # Get assignee
-            assignee_result = await session.execute(
-                select(User).where(User.id == task.assignee_id)
-            )
-            assignee = assignee_result.scalar_one()
-            
-            task_list.append({
-                "id": task.id,
-                "text": task.text,
-                "assignee": assignee.display_name,
-                "deadline": task.deadline.isoformat(),
-                "status": task.status.value,
-                "recurrence": task.recurrence.value if task.recurrence else "none",
-            })
+        result = await session.execute(
+            select(User).where(User.first_name.ilike(f"%{name}%"))
+        )
+        return result.scalar_one_or_none()
+
+
+# Default chat per user LRU: user_id -> (chat_id, cached_at). Leaving a chat is
+# recorded by the bot process, so entries cannot be dropped from here and expire
+# as quickly as cached users.
+_default_chat_cache: OrderedDict[int, tuple[int, float]] = OrderedDict()
+DEFAULT_CHAT_CACHE_TTL = USER_CACHE_TTL
+DEFAULT_CHAT_CACHE_MAX = 10_000
+
+
+async def _get_default_chat_id(user_id: int) -> Optional[int]:
+    """Get default chat ID for user (first chat user is in; cached, own session)."""
+    now = time.monotonic()
+    cached = _default_chat_cache.get(user_id)
+    if cached is not None and now - cached[1] < DEFAULT_CHAT_CACHE_TTL:
+        _default_chat_cache.move_to_end(user_id)
+        return cached[0]
+    
+    async with get_session() as session:
+        result = await session.execute(
+            select(ChatMember.chat_id)
+            .where(ChatMember.user_id == user_id)
+            .where(ChatMember.left_at.is_(None))
+            .order_by(ChatMember.joined_at)
+            .limit(1)
+        )
+        chat_id = result.scalar_one_or_none()
+    
+    if chat_id is not None:
+        _default_chat_cache[user_id] = (chat_id, now)
+        _default_chat_cache.move_to_end(user_id)
+        while len(_default_chat_cache) > DEFAULT_CHAT_CACHE_MAX:
+            _default_chat_cache.popitem(last=False)
+    else:
+        _default_chat_cache.pop(user_id, None)
+    return chat_id
+
+
+async def _no_result() -> None:
+    """Placeholder for a skipped lookup in asyncio.gather."""
+    return None
+
+
+# Inserts from concurrent requests arriving within this window share one statement
+INSERT_BATCH_WINDOW = 0.02  # seconds
+INSERT_BATCH_MAX = 100
+
+
+class InsertCoalescer:
+    """
+    Collect rows for one model from concurrent requests and insert them
+    with a single multi-row INSERT ... RETURNING id and one commit.
+    """
+
+    def __init__(
+        self,
+        model,
+        window: float = INSERT_BATCH_WINDOW,
+        max_batch: int = INSERT_BATCH_MAX
+    ):
+        self.model = model
+        self.window = window
+        self.max_batch = max_batch
+        self._pending: list[tuple[dict, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._flushes: set[asyncio.Task] = set()
+
+    async def insert(self, row: dict) -> int:
+        """Queue row for insertion and wait for its assigned ID."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((row, future))
+        
+        if len(self._pending) >= self.max_batch:
+            self._flush_pending()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._flush_pending)
+        
+        return await future
+
+    def _flush_pending(self) -> None:
+        """Hand the pending rows over to a background flush."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.create_task(self._flush(batch))
+            self._flushes.add(task)
+            task.add_done_callback(self._flushes.discard)
+
+    async def _flush(self, batch: list[tuple[dict, asyncio.Future]]) -> None:
+        """Insert batch and resolve each waiting request with its ID."""
+        try:
+            async with get_session() as session:
+                result = await session.execute(
+                    insert(self.model).returning(self.model.id, sort_by_parameter_order=True),
+                    [row for row, _ in batch]
+                )
+                ids = result.scalars().all()
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
         
-        return task_list
+        for (_, future), row_id in zip(batch, ids):
+            if not future.done():
+                future.set_result(row_id)
+
+
+_task_inserts = InsertCoalescer(Task)
+_expense_inserts = InsertCoalescer(Expense)
+_reminder_inserts = InsertCoalescer(Reminder)
 
 
 @app.post("/api/tasks")
-async def create_task_api(task_data: TaskCreate, request: Request):
+async def create_task_api(
+    task_data: TaskCreate,
+    request: Request,
+    session: AsyncSession = Depends(db_session)
+):
     """Create a new task."""
-    user = await get_current_user(request)
+    user = await get_current_user(request, session)
     if not user:
         raise HTTPException(status_code=401, detail="Unauthorized")
     
-    async with get_session() as session:
-        # Parse assignee
-        assignee_id = user.id
-        if task_data.assignee:
-            # Try to find user by username or name
-            assignee_result = await session.execute(
-                select(User).where(
-                    (User.username == task_data.assignee.replace('@', '')) |
-                    (User.first_name.ilike(f"%{task_data.assignee}%"))
-                )
-            )
-            assignee = assignee_result.scalar_one_or_none()
-            if assignee:
-                assignee_id = assignee.id
-        
-        # Parse deadline
-        deadline = datetime.utcnow() + timedelta(days=1)
-        if task_data.deadline:
-            try:
-                deadline = parse_deadline(task_data.deadline)
-            except DateParseError:
-                pass
-        
-        # Create task
-        from database.models import RecurrenceType
-        recurrence_map = {
-            "none": RecurrenceType.NONE,
-            "daily": RecurrenceType.DAILY,
-            "weekdays": RecurrenceType.WEEKDAYS,
-            "weekly": RecurrenceType.WEEKLY,
-            "monthly": RecurrenceType.MONTHLY,
-        }
-        recurrence = recurrence_map.get(task_data.recurrence, RecurrenceType.NONE)
-        
-        # Get default chat (for now, use first chat user is in)
-        chat_result = await session.execute(
-            select(Chat).join(User).where(User.id == user.id).limit(1)
-        )
-        chat = chat_result.scalar_one_or_none()
-        
-        if not chat:
-            raise HTTPException(status_code=400, detail="No chat found")
-        
-        task = Task(
-            chat_id=chat.id,
-            author_id=user.id,
-            assignee_id=assignee_id,
-            text=task_data.text,
-            deadline=deadline,
-            recurrence=recurrence,
-        )
-        session.add(task)
-        await session.commit()
-        
-        return {"id": task.id, "message": "Task created"}
+    # Assignee and chat lookups are independent: run them on separate connections
+    assignee, chat_id = await asyncio.gather(
+        _find_assignee(task_data.assignee) if task_data.assignee else _no_result(),
+        _get_default_chat_id(user.id),
+    )
+    
+    # Parse assignee
+    assignee_id = assignee.id if assignee else user.id
+    
+    # Parse deadline
+    deadline = datetime.utcnow() + timedelta(days=1)
+    if task_data.deadline:
+        try:
+            deadline = parse_deadline(task_data.deadline)
+        except DateParseError:
+            pass
+    
+    # Create task
+    recurrence = RECURRENCE_MAP.get(task_data.recurrence, RecurrenceType.NONE)
+    
+    if not chat_id:
+        raise HTTPException(status_code=400, detail="No chat found")
+    
+    task_id = await _task_inserts.insert({
+        "chat_id": chat_id,
+        "author_id": user.id,
+        "assignee_id": assignee_id,
+        "text": task_data.text,
+        "deadline": deadline,
+        "recurrence": recurrence,
+    })
+    _invalidate_response("tasks", assignee_id)
+    
+    return {"id": task_id, "message": "Task created"}
 
 
 @app.post("/api/tasks/{task_id}/close")
-async def close_task_api(task_id: int, request: Request):
+async def close_task_api(
+    task_id: int,
+    request: Request,
+    session: AsyncSession = Depends(db_session)
+):
     """Close a task."""
-    user = await get_current_user(request)
+    user = await get_current_user(request, session)
     if not user:
         raise HTTPException(status_code=401, detail="Unauthorized")
     
-    async with get_session() as session:
-        result = await session.execute(
-            select(Task).where(Task.id == task_id)
-        )
-        task = result.scalar_one_or_none()
-        
-        if not task:
-            raise HTTPException(status_code=404, detail="Task not found")
-        
-        if task.assignee_id != user.id and task.author_id != user.id:
-            raise HTTPException(status_code=403, detail="Not authorized")
-        
-        task.status = TaskStatus.CLOSED
-        task.closed_at = datetime.utcnow()
-        task.closed_by = user.id
-        
-        await session.commit()
-        
-        return {"message": "Task closed"}
+    result = await session.execute(
+        select(Task).where(Task.id == task_id)
+    )
+    task = result.scalar_one_or_none()
+    
+    if not task:
+        raise HTTPException(status_code=404, detail="Task not found")
+    
+    if task.assignee_id != user.id and task.author_id != user.id:
+        raise HTTPException(status_code=403, detail="Not authorized")
+    
+    task.status = TaskStatus.CLOSED
+    task.closed_at = datetime.utcnow()
+    task.closed_by = user.id
+    
+    await session.commit()
+    _invalidate_response("tasks", task.assignee_id)
+    
+    return {"message": "Task closed"}
 
 
 @app.get("/api/expenses")
-async def get_expenses(request: Request):
+async def get_expenses(request: Request, session: AsyncSession = Depends(db_session)):
     """Get user's expenses."""
-    user = await get_current_user(request)
+    user = await get_current_user(request, session)
     if not user:
         raise HTTPException(status_code=401, detail="Unauthorized")
     
-    async with get_session() as session:
-        # Get expenses from last 30 days
-        cutoff = datetime.utcnow() - timedelta(days=30)
-        
-        result = await session.execute(
-            select(Expense)
-            .where(Expense.user_id == user.id)
-            .where(Expense.created_at >= cutoff)
-            .order_by(Expense.created_at.desc())
-        )
-        expenses = result.scalars().all()
-        
-        # Calculate stats
-        today = datetime.utcnow().date()
-        today_start = datetime.combine(today, datetime.min.time())
-        
-        today_result = await session.execute(
-            select(func.sum(Expense.amount))
-            .where(Expense.user_id == user.id)
-            .where(Expense.created_at >= today_start)
-        )
-        today_total = today_result.scalar() or 0
-        
-        month_start = datetime.utcnow().replace(day=1)
-        month_result = await session.execute(
-            select(func.sum(Expense.amount))
-            .where(Expense.user_id == user.id)
-            .where(Expense.created_at >= month_start)
+    cached = _get_cached_response("expenses", user.id)
+    if cached is not None:
+        return cached
+    
+    # Get expenses from last 30 days
+    cutoff = datetime.utcnow() - timedelta(days=30)
+    
+    result = await session.execute(
+        select(
+            Expense.id, Expense.amount, Expense.description,
+            Expense.category, Expense.created_at
         )
-        month_total = month_result.scalar() or 0
-        
-        expense_list = []
-        for expense in expenses:
-            expense_list.append({
-                "id": expense.id,
-                "amount": float(expense.amount),
-                "description": expense.description,
-                "category": expense.category,
-                "created_at": expense.created_at.isoformat(),
-            })
-        
-        return {
-            "expenses": expense_list,
-            "stats": {
-                "today": float(today_total),
-                "month": float(month_total),
-            }
+        .where(Expense.author_id == user.id)
+        .where(Expense.created_at >= cutoff)
+        .order_by(Expense.created_at.desc())
+    )
+    expenses = result.all()
+    
+    # Calculate stats from the same rows: today and this month both start
+    # within the last 30 days, so no extra queries are needed
+    today = datetime.utcnow().date()
+    today_start = datetime.combine(today, datetime.min.time())
+    month_start = datetime.utcnow().replace(day=1)
+    
+    today_total = 0
+    month_total = 0
+    expense_list = []
+    for expense in expenses:
+        if expense.created_at >= today_start:
+            today_total += expense.amount
+        if expense.created_at >= month_start:
+            month_total += expense.amount
+        
+        expense_list.append({
+            "id": expense.id,
+            "amount": float(expense.amount),
+            "description": expense.description,
+            "category": expense.category,
+            "created_at": expense.created_at,
+        })
+    
+    return _cache_response("expenses", user.id, {
+        "expenses": expense_list,
+        "stats": {
+            "today": float(today_total),
+            "month": float(month_total),
         }
+    })
 
 
 @app.post("/api/expenses")
-async def create_expense_api(expense_data: ExpenseCreate, request: Request):
+async def create_expense_api(
+    expense_data: ExpenseCreate,
+    request: Request,
+    session: AsyncSession = Depends(db_session)
+):
     """Create a new expense."""
-    user = await get_current_user(request)
+    user = await get_current_user(request, session)
     if not user:
         raise HTTPException(status_code=401, detail="Unauthorized")
     
-    async with get_session() as session:
-        # Auto-categorize expense
-        from utils.categories import categorize_expense
-        category = categorize_expense(expense_data.description)
-        
-        expense = Expense(
-            user_id=user.id,
-            amount=expense_data.amount,
-            description=expense_data.description,
-            category=category,
-        )
-        session.add(expense)
-        await session.commit()
-        
-        return {"id": expense.id, "message": "Expense created"}
+    # Auto-categorize expense
+    category = categorize_expense(expense_data.description)
+    
+    chat_id = await _get_default_chat_id(user.id)
+    if not chat_id:
+        raise HTTPException(status_code=400, detail="No chat found")
+    
+    expense_id = await _expense_inserts.insert({
+        "chat_id": chat_id,
+        "author_id": user.id,
+        "amount": expense_data.amount,
+        "description": expense_data.description,
+        "category": category,
+    })
+    _invalidate_response("expenses", user.id)
+    
+    return {"id": expense_id, "message": "Expense created"}
 
 
 @app.get("/api/reminders")
-async def get_reminders(request: Request):
+async def get_reminders(request: Request, session: AsyncSession = Depends(db_session)):
     """Get user's reminders."""
-    user = await get_current_user(request)
+    user = await get_current_user(request, session)
     if not user:
         raise HTTPException(status_code=401, detail="Unauthorized")
     
-    async with get_session() as session:
-        result = await session.execute(
-            select(Reminder)
-            .where(Reminder.recipient_id == user.id)
-            .where(Reminder.status == ReminderStatus.PENDING)
-            .order_by(Reminder.remind_at)
-        )
-        reminders = result.scalars().all()
-        
-        reminder_list = []
-        for reminder in reminders:
-            reminder_list.append({
-                "id": reminder.id,
-                "text": reminder.text,
-                "remind_at": reminder.remind_at.isoformat(),
-            })
-        
-        return reminder_list
+    cached = _get_cached_response("reminders", user.id)
+    if cached is not None:
+        return cached
+    
+    result = await session.execute(
+        select(Reminder.id, Reminder.text, Reminder.remind_at)
+        .where(Reminder.recipient_id == user.id)
+        .where(Reminder.status == ReminderStatus.PENDING)
+        .order_by(Reminder.remind_at)
+    )
+    reminders = result.all()
+    
+    return _cache_response("reminders", user.id, [
+        {
+            "id": reminder.id,
+            "text": reminder.text,
+            "remind_at": reminder.remind_at,
+        }
+        for reminder in reminders
+    ])
 
 
 @app.post("/api/reminders")
-async def create_reminder_api(reminder_data: ReminderCreate, request: Request):
+async def create_reminder_api(
+    reminder_data: ReminderCreate,
+    request: Request,
+    session: AsyncSession = Depends(db_session)
+):
     """Create a new reminder."""
-    user = await get_current_user(request)
+    user = await get_current_user(request, session)
     if not user:
         raise HTTPException(status_code=401, detail="Unauthorized")
     
-    async with get_session() as session:
-        # Parse time
-        try:
-            remind_at = parse_reminder_time(reminder_data.time)
-        except DateParseError as e:
-            raise HTTPException(status_code=400, detail=str(e))
-        
-        # Get default chat
-        chat_result = await session.execute(
-            select(Chat).join(User).where(User.id == user.id).limit(1)
-        )
-        chat = chat_result.scalar_one_or_none()
-        
-        if not chat:
-            raise HTTPException(status_code=400, detail="No chat found")
-        
-        reminder = Reminder(
-            chat_id=chat.id,
-            author_id=user.id,
-            recipient_id=user.id,
-            text=reminder_data.text,
-            remind_at=remind_at,
-        )
-        session.add(reminder)
-        await session.commit()
-        
-        return {"id": reminder.id, "message": "Reminder created"}
+    # Parse time
+    try:
+        remind_at = parse_reminder_time(reminder_data.time)
+    except DateParseError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    # Get default chat
+    chat_id = await _get_default_chat_id(user.id)
+    if not chat_id:
+        raise HTTPException(status_code=400, detail="No chat found")
+    
+    reminder_id = await _reminder_inserts.insert({
+        "chat_id": chat_id,
+        "author_id": user.id,
+        "recipient_id": user.id,
+        "text": reminder_data.text,
+        "remind_at": remind_at,
+    })
+    _invalidate_response("reminders", user.id)
+    
+    return {"id": reminder_id, "message": "Reminder created"}
 
 
 @app.get("/api/summary")
-async def get_summary(request: Request):
+async def get_summary(request: Request, session: AsyncSession = Depends(db_session)):
     """Get chat summary."""
-    user = await get_current_user(request)
+    user = await get_current_user(request, session)
     if not user:
         raise HTTPException(status_code=401, detail="Unauthorized")
     
-    async with get_session() as session:
-        # Get first chat user is in
-        chat_result = await session.execute(
-            select(Chat).join(User).where(User.id == user.id).limit(1)
-        )
-        chat = chat_result.scalar_one_or_none()
-        
-        if not chat:
-            return {"text": "Нет чатов для саммаризации"}
-        
-        # Get messages from last 24 hours
-        cutoff = datetime.utcnow() - timedelta(hours=24)
-        
-        result = await session.execute(
-            select(Message)
-            .where(Message.chat_id == chat.id)
-            .where(Message.is_bot_command == False)
-            .where(Message.created_at >= cutoff)
-            .order_by(Message.created_at)
-        )
-        messages = result.scalars().all()
-        
-        if not messages:
-            return {"text": "Переписок не было"}
-        
-        # Format messages
-        formatted = []
-        for msg in messages:
-            user_result = await session.execute(
-                select(User).where(User.id == msg.user_id)
-            )
-            msg_user = user_result.scalar_one_or_none()
-            username = msg_user.display_name if msg_user else "Unknown"
-            formatted.append(f"{username}: {msg.text}")
-        
-        # Generate summary
-        from llm.summarizer import summarize_messages
-        summary_text = await summarize_messages(formatted)
-        
-        return {"text": summary_text}
+    cached = _get_cached_response("summary", user.id)
+    if cached is not None:
+        return cached
+    
+    # Get first chat user is in
+    chat_id = await _get_default_chat_id(user.id)
+    if not chat_id:
+        return {"text": "Нет чатов для саммаризации"}
+    
+    # Get messages from last 24 hours
+    cutoff = datetime.utcnow() - timedelta(hours=24)
+    
+    # Stream the most recent messages with their authors (one query, newest
+    # first so the DB applies the cap; rows formatted as they arrive)
+    rows = await session.stream(
+        select(Message.text, User)
+        .outerjoin(User, User.id == Message.user_id)
+        .where(Message.chat_id == chat_id)
+        .where(Message.is_bot_command == False)
+        .where(Message.created_at >= cutoff)
+        .order_by(Message.created_at.desc())
+        .limit(settings.summary_max_messages)
+        .execution_options(yield_per=SUMMARY_STREAM_BATCH_SIZE)
+    )
+    formatted = [
+        f"{msg_user.display_name if msg_user else 'Unknown'}: {text}"
+        async for text, msg_user in rows
+    ]
+    formatted.reverse()
+    
+    if not formatted:
+        return {"text": "Переписок не было"}
+    
+    # Generate summary
+    summary_text = await summarize_messages(formatted)
+    
+    return _cache_response("summary", user.id, {"text": summary_text})
 